@@ -2,7 +2,8 @@
 """
 This file contains parameters for Mindboggle to fill settings in setup.py,
 the Mindboggle top-level docstring, and for building the docs.
-In setup.py we execute this file, so it cannot import mindboggle.
+setup.py parses (does not execute) this file, so only literal assignments
+and names assigned from them (or from mindboggle/version.py) reach setup().
 """
 
 # Format expected by setup.py and doc/source/conf.py: string of form "X.Y.Z"
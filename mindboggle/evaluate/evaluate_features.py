@@ -573,8 +573,8 @@ if __name__ == "__main__":
                         if np.isnan(value):
                             rgb = [0, 0, 0]
                         else:
-                            rgb = [np.int(255 * x) for x in
-                                   colors[np.int(255 * value / maxd)]]
+                            rgb = [int(255 * x) for x in
+                                   colors[int(255 * value / maxd)]]
                         hex = "#%02x%02x%02x" % tuple(rgb)
                         colorx.append(hex)
 
@@ -64,13 +64,14 @@ def evaluate_volume_overlaps(labels, file1, file2,
     ...     output_file=output_file, save_output=save_output) # doctest: +SKIP
 
     """
+    import numpy as np
     import nibabel as nb
 
     from mindboggle.guts.compute import compute_overlaps
 
     # Load labeled image volumes:
-    list1 = nb.load(file1).get_data().ravel()
-    list2 = nb.load(file2).get_data().ravel()
+    list1 = np.asanyarray(nb.load(file1).dataobj).ravel()
+    list2 = np.asanyarray(nb.load(file2).dataobj).ravel()
 
     dice_overlaps, jacc_overlaps, output_file = compute_overlaps(labels,
         list1, list2, output_file=output_file, save_output=save_output)
@@ -355,7 +356,10 @@ if __name__ == "__main__":
         dice_file = os.path.join(vol_overlap_path, 'subjects_by_labels_dices' + file_append)
         vol_overlap_path = os.path.join(vol_overlap_path, vol_overlap_dir)
         files = os.listdir(vol_overlap_path)
-        subjects = [x.strip(file_append) for x in files]
+        # Remove the file_append suffix (str.strip() would instead remove
+        # any of its characters from both ends of the subject name):
+        subjects = [x[:-len(file_append)] if x.endswith(file_append) else x
+                    for x in files]
         if concat_tables:
             jaccards = np.zeros((len(files), len(labels)))
             dices = jaccards.copy()
@@ -366,8 +370,8 @@ if __name__ == "__main__":
                     for irow in range(columns.shape[0]):
                         if int(columns.iloc[irow][0].split()[0]) == label:
                             row = columns.iloc[irow][0].split()[1::]
-                            dices[ifile, ilabel] = np.float(row[0])
-                            jaccards[ifile, ilabel] = np.float(row[1])
+                            dices[ifile, ilabel] = float(row[0])
+                            jaccards[ifile, ilabel] = float(row[1])
 
             df_jaccards = pd.DataFrame(jaccards, index=subjects, columns=labels)
             df_dices = pd.DataFrame(dices, index=subjects, columns=labels)
@@ -394,8 +398,8 @@ if __name__ == "__main__":
                 label_namex.append(label_names[ilabel])
                 subjectx.append(subject)
                 valuex.append(data[label][subject])
-                rgb = [np.int(255 * x) for x in
-                       colors[np.int(255 * data.iloc[isubject, ilabel])]]
+                rgb = [int(255 * x) for x in
+                       colors[int(255 * data.iloc[isubject, ilabel])]]
                 hex = "#%02x%02x%02x" % tuple(rgb)
                 colorx.append(hex)
 
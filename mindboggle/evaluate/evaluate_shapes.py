@@ -464,8 +464,8 @@ if __name__ == "__main__":
                     elif abs_fraction > 1.0:
                         rgb = [1, 1, 1]
                     else:
-                        rgb = [np.int(255 * x) for x in
-                               colors[np.int(255 * abs_fraction)]]
+                        rgb = [int(255 * x) for x in
+                               colors[int(255 * abs_fraction)]]
                     hex = "#%02x%02x%02x" % tuple(rgb)
                     colorx.append(hex)
 
@@ -716,8 +716,8 @@ if __name__ == "__main__":
                     elif abs_fraction > 1.0:
                         rgb = [1, 1, 1]
                     else:
-                        rgb = [np.int(255 * x) for x in
-                               colors[np.int(255 * abs_fraction)]]
+                        rgb = [int(255 * x) for x in
+                               colors[int(255 * abs_fraction)]]
                     hex = "#%02x%02x%02x" % tuple(rgb)
                     colorx.append(hex)
 
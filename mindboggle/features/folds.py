@@ -53,7 +53,7 @@ def find_depth_threshold(depth_file, min_vertices=10000, verbose=False):
     >>> verbose = False
     >>> depth_threshold, bins, bin_edges = find_depth_threshold(depth_file,
     ...     min_vertices, verbose)
-    >>> np.float("{0:.{1}f}".format(depth_threshold, 5))
+    >>> float("{0:.{1}f}".format(depth_threshold, 5))
     2.36089
 
     View threshold histogram plots (skip test):
@@ -97,7 +97,7 @@ def find_depth_threshold(depth_file, min_vertices=10000, verbose=False):
     # Compute histogram of depth measures:
     # ------------------------------------------------------------------------
     if npoints > min_vertices:
-        nbins = np.int(np.round(npoints / 100.0))
+        nbins = int(np.round(npoints / 100.0))
     else:
         raise IOError("  Expecting at least {0} vertices to create "
                       "depth histogram".format(min_vertices))
@@ -267,12 +267,10 @@ def extract_folds(depth_file, depth_threshold=2, min_fold_size=50,
         if min_fold_size > 1:
             if verbose:
                 print('  Remove folds smaller than {0}'.format(min_fold_size))
-            unique_folds = [x for x in np.unique(folds)
-                            if x != background_value]
-            for nfold in unique_folds:
-                indices_fold = [i for i,x in enumerate(folds) if x == nfold]
-                if len(indices_fold) < min_fold_size:
-                    folds[indices_fold] = background_value
+            unique_folds, fold_sizes = np.unique(folds, return_counts=True)
+            small_folds = [x for x, size in zip(unique_folds, fold_sizes)
+                           if x != background_value and size < min_fold_size]
+            folds[np.isin(folds, small_folds)] = background_value
 
         # --------------------------------------------------------------------
         # Find and fill holes in the folds
@@ -289,8 +287,7 @@ def extract_folds(depth_file, depth_threshold=2, min_fold_size=50,
         renumber_folds = background_value * np.ones(npoints)
         fold_numbers = [x for x in np.unique(folds) if x != background_value]
         for i_fold, n_fold in enumerate(fold_numbers):
-            fold_indices = [i for i,x in enumerate(folds) if x == n_fold]
-            renumber_folds[fold_indices] = i_fold
+            renumber_folds[folds == n_fold] = i_fold
         folds = renumber_folds
         folds = [int(x) for x in folds]
         n_folds = i_fold + 1
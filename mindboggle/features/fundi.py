@@ -178,8 +178,16 @@ def extract_fundi(folds, curv_file, depth_file, min_separation=10,
             print("Extract a fundus from each of {0} folds...".
                   format(len(unique_fold_IDs)))
 
+    # Find inner anchor points (these do not depend on the fold):
+    inner_anchors = find_max_values(points, values, min_separation, thr)
+
+    # Group vertex indices by fold with one stable sort:
+    fold_order = np.argsort(folds, kind='stable')
+    sorted_folds = folds[fold_order]
+
     for fold_ID in unique_fold_IDs:
-        indices_fold = [i for i,x in enumerate(folds) if x == fold_ID]
+        indices_fold = fold_order[np.searchsorted(sorted_folds, fold_ID):
+            np.searchsorted(sorted_folds, fold_ID, side='right')].tolist()
         if indices_fold:
             if verbose:
                 print('  Fold {0}:'.format(int(fold_ID)))
@@ -192,12 +200,6 @@ def extract_fundi(folds, curv_file, depth_file, min_separation=10,
                 neighbor_lists, values, depths, min_separation,
                 background_value, verbose)
 
-            # ----------------------------------------------------------------
-            # Find inner anchor points:
-            # ----------------------------------------------------------------
-            inner_anchors = find_max_values(points, values, min_separation,
-                                            thr)
-
             # ----------------------------------------------------------------
             # Connect anchor points to create skeleton:
             # ----------------------------------------------------------------
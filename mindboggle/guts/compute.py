@@ -32,7 +32,7 @@ def distcorr(X, Y):
     >>> a = [1,2,3,4,5]
     >>> b = [1,2,9,4,4]
     >>> dcor = distcorr(a, b)
-    >>> np.float("{0:.{1}f}".format(dcor, 5))
+    >>> float("{0:.{1}f}".format(dcor, 5))
     0.76268
 
     Copyright (2014-2015) MIT
@@ -110,7 +110,7 @@ def point_distance(point, points):
 
     # If points is a set of multiple points
     elif np.ndim(points) == 2:
-        min_distance = np.Inf
+        min_distance = np.inf
         min_index = 0
         point = np.array(point)
         for index, point2 in enumerate(points):
@@ -565,17 +565,17 @@ def means_per_label(values, labels, include_labels=[], exclude_labels=[], areas=
     >>> # Compute mean curvature per label normalized by area:
     >>> means, sdevs, label_list, label_areas = means_per_label(values, labels,
     ...     include_labels, exclude_labels, areas)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in means[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in means[0:5]]
     [-1.1793, -1.21405, -2.49318, -3.58116, -3.34987]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in sdevs[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in sdevs[0:5]]
     [2.43827, 2.33857, 2.0185, 3.25964, 2.8274]
     >>> # Compute mean curvature per label:
     >>> areas = []
     >>> means, sdevs, label_list, label_areas = means_per_label(values, labels,
     ...     include_labels, exclude_labels, areas)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in means[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in means[0:5]]
     [-0.99077, -0.3005, -1.59342, -2.03939, -2.31815]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in sdevs[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in sdevs[0:5]]
     [2.3486, 2.4023, 2.3253, 3.31023, 2.91794]
 
     >>> # FIX: compute mean coordinates per label:
@@ -607,34 +607,52 @@ def means_per_label(values, labels, include_labels=[], exclude_labels=[], areas=
     else:
         dim = 1
 
+    # Accumulate per-label sums with np.bincount (one pass over vertices)
+    # rather than gathering the vertices of each label in turn:
+    unique_labels, inverse = np.unique(labels, return_inverse=True)
+    inverse = inverse.ravel()
+    nunique = len(unique_labels)
+    X = values.reshape(len(inverse), dim)
+    counts = np.bincount(inverse, minlength=nunique)
+    nonempty = np.maximum(counts, 1)
+    plain_means = np.empty((nunique, dim))
+    plain_sdevs = np.empty((nunique, dim))
+    for d in range(dim):
+        plain_means[:, d] = np.bincount(inverse, X[:, d], nunique) / nonempty
+        Xdiff = X[:, d] - plain_means[inverse, d]
+        plain_sdevs[:, d] = np.sqrt(np.bincount(inverse, Xdiff**2,
+                                                nunique) / nonempty)
+    if np.size(areas):
+        sumWs = np.bincount(inverse, areas, nunique)
+        positive = np.where(sumWs > 0, sumWs, 1)
+        weighted_means = np.empty((nunique, dim))
+        weighted_sdevs = np.empty((nunique, dim))
+        for d in range(dim):
+            weighted_means[:, d] = np.bincount(inverse, areas * X[:, d],
+                                               nunique) / positive
+            Xdiff = X[:, d] - plain_means[inverse, d]
+            weighted_sdevs[:, d] = np.sqrt(np.bincount(inverse,
+                areas * Xdiff**2, nunique) / positive)
+
     for label in label_list:
-        I = [i for i,x in enumerate(labels) if x == label]
-        if I:
-            X = values[I]
+        j = np.searchsorted(unique_labels, label)
+        if j < nunique and unique_labels[j] == label:
+            if dim > 1:
+                mean, sdev = plain_means[j], plain_sdevs[j]
+            else:
+                mean, sdev = plain_means[j, 0], plain_sdevs[j, 0]
             if np.size(areas):
-                W = areas[I]
-                sumW = sum(W)
+                sumW = sumWs[j]
                 label_areas.append(sumW)
                 if sumW > 0:
                     if dim > 1:
-                        W = np.transpose(np.tile(W, (dim,1)))
-                    means.append(np.sum(W * X, axis=0) / sumW)
-                    Xdiff = X - np.mean(X, axis=0)
-                    sdevs.append(np.sqrt(np.sum(W * Xdiff**2, axis=0) / sumW))
-                else:
-                    if dim > 1:
-                        means.append(np.mean(X, axis=0))
-                        sdevs.append(np.std(X, axis=0))
+                        mean = weighted_means[j]
+                        sdev = weighted_sdevs[j]
                     else:
-                        means.append(np.mean(X))
-                        sdevs.append(np.std(X))
-            else:
-                if dim > 1:
-                    means.append(np.mean(X, axis=0))
-                    sdevs.append(np.std(X, axis=0))
-                else:
-                    means.append(np.mean(X))
-                    sdevs.append(np.std(X))
+                        mean = weighted_means[j, 0]
+                        sdev = weighted_sdevs[j, 0]
+            means.append(mean)
+            sdevs.append(sdev)
         else:
             means.append(np.zeros(dim))
             sdevs.append(np.zeros(dim))
@@ -686,7 +704,7 @@ def sum_per_label(values, labels, include_labels=[], exclude_labels=[]):
     >>> # Compute sum area per label:
     >>> sums, label_list = sum_per_label(values, labels, include_labels,
     ...                                  exclude_labels)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in sums[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in sums[0:5]]
     [-8228.32913, -424.90109, -1865.8959, -8353.33769, -5130.06613]
 
     """
@@ -701,12 +719,17 @@ def sum_per_label(values, labels, include_labels=[], exclude_labels=[]):
     else:
         label_list = np.unique(labels)
     label_list = [int(x) for x in label_list if int(x) not in exclude_labels]
+    # Sum values per label in one pass with np.bincount:
+    unique_labels, inverse = np.unique(labels, return_inverse=True)
+    inverse = inverse.ravel()
+    row_sums = values.reshape(len(inverse), -1).sum(axis=1)
+    label_sums = np.bincount(inverse, row_sums, len(unique_labels))
+
     sums = []
     for label in label_list:
-        I = [i for i,x in enumerate(labels) if x == label]
-        if I:
-            X = values[I]
-            sums.append(np.sum(X))
+        j = np.searchsorted(unique_labels, label)
+        if j < len(unique_labels) and unique_labels[j] == label:
+            sums.append(label_sums[j])
         else:
             sums.append(0)
 
@@ -788,13 +811,13 @@ def stats_per_label(values, labels, include_labels=[], exclude_labels=[],
     >>> precision = 1
     >>> medians, mads, means, sdevs, skews, kurts, lower_quarts, upper_quarts, label_list = stats_per_label(values,
     ...     labels, include_labels, exclude_labels, weights, precision)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in medians[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in medians[0:5]]
     [-1.13602, -1.22961, -2.49665, -3.80782, -3.37309]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in mads[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in mads[0:5]]
     [1.17026, 1.5045, 1.28234, 2.11515, 1.69333]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in means[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in means[0:5]]
     [-1.1793, -1.21405, -2.49318, -3.58116, -3.34987]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in kurts[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in kurts[0:5]]
     [2.34118, -0.3969, -0.55787, -0.73993, 0.3807]
 
     """
@@ -808,12 +831,21 @@ def stats_per_label(values, labels, include_labels=[], exclude_labels=[],
     if not isinstance(weights, np.ndarray):
         weights = np.asarray(weights)
 
+    # Group vertex indices by label in one pass (stable, so indices stay in
+    # ascending order within each label):
+    unique_labels, inverse = np.unique(labels, return_inverse=True)
+    inverse = inverse.ravel()
+    label_ends = np.cumsum(np.bincount(inverse, minlength=len(unique_labels)))
+    label_starts = np.concatenate(([0], label_ends[:-1]))
+    grouped_indices = np.argsort(inverse, kind='stable')
+
     # Initialize all statistical lists:
     if include_labels:
-        label_list = include_labels
+        label_list = np.asarray(include_labels)
     else:
-        label_list = np.unique(labels)
-    label_list = [int(x) for x in label_list if int(x) not in exclude_labels]
+        label_list = unique_labels
+    label_list = label_list.astype(int)
+    label_list = label_list[~np.isin(label_list, exclude_labels)].tolist()
     medians = []
     mads = []
     means = []
@@ -825,8 +857,12 @@ def stats_per_label(values, labels, include_labels=[], exclude_labels=[],
 
     # Extract all vertex indices for each label:
     for label in label_list:
-        I = [i for i,x in enumerate(labels) if x == label]
-        if I:
+        ilabel = np.searchsorted(unique_labels, label)
+        if ilabel < len(unique_labels) and unique_labels[ilabel] == label:
+            I = grouped_indices[label_starts[ilabel]:label_ends[ilabel]]
+        else:
+            I = []
+        if len(I):
             # Get the vertex values:
             X = values[I]
             if len([x for x in X if x != 0]):
@@ -932,6 +968,7 @@ def count_per_label(labels, include_labels=[], exclude_labels=[]):
     >>> counts
     [0, 3, 4, 5]
 
+    >>> import numpy as np
     >>> import nibabel as nb
     >>> from mindboggle.mio.vtks import read_scalars
     >>> from mindboggle.mio.labels import DKTprotocol
@@ -940,8 +977,8 @@ def count_per_label(labels, include_labels=[], exclude_labels=[]):
     >>> urls, fetch_data = prep_tests()
     >>> labels_file = fetch_data(urls['freesurfer_labels'], '', '.nii.gz')
     >>> img = nb.load(labels_file)
-    >>> hdr = img.get_header()
-    >>> labels = img.get_data().ravel()
+    >>> hdr = img.header
+    >>> labels = np.asanyarray(img.dataobj).ravel()
     >>> dkt = DKTprotocol()
     >>> include_labels = dkt.label_numbers
     >>> exclude_labels = []
@@ -961,12 +998,20 @@ def count_per_label(labels, include_labels=[], exclude_labels=[]):
     else:
         raise IOError("labels should be a numpy array.")
 
+    # Count all unique labels in a single pass if none are specified:
+    if not include_labels:
+        label_list, label_counts = np.unique(labels, return_counts=True)
+        unique_labels = []
+        counts = []
+        for label, count in zip(label_list.tolist(), label_counts.tolist()):
+            if int(label) not in exclude_labels:
+                unique_labels.append(int(label))
+                counts.append(count)
+        return unique_labels, counts
+
     # Unique list of labels:
-    if include_labels:
-        label_list = include_labels
-    else:
-        label_list = np.unique(labels).tolist()
-    label_list = [int(x) for x in label_list if int(x) not in exclude_labels]
+    label_list = [int(x) for x in include_labels
+                  if int(x) not in exclude_labels]
 
     # Loop through labels:
     unique_labels = []
@@ -1064,8 +1109,8 @@ def compute_overlaps(targets, list1, list2, output_file='', save_output=True,
         if len2 * len1 > 0:
 
             # Compute Dice and Jaccard coefficients:
-            dice = np.float(2.0 * len_intersection) / (len2 + len1)
-            jacc = np.float(len_intersection) / len_union
+            dice = float(2.0 * len_intersection) / (len2 + len1)
+            jacc = float(len_intersection) / len_union
             dice_overlaps[itarget] = dice
             jacc_overlaps[itarget] = jacc
             if verbose:
@@ -1125,7 +1170,7 @@ def compute_image_histogram(infile, nbins=100, threshold=0.0):
     # Compute histogram
     # ------------------------------------------------------------------------
     # Load image
-    data = nb.load(infile).get_data().ravel()
+    data = np.asanyarray(nb.load(infile).dataobj).ravel()
 
     # Threshold image
     if threshold > 0:
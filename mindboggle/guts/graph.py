@@ -133,9 +133,9 @@ def weight_graph(Nodes, Indices, Meshes, kernel=rbf_kernel, add_to_graph=True,
         elif Meshes.shape[1] == 2:
             edge_mat = Meshes
         # Augment matrix to contain edge weight in the third column
-        weighted_edges = np.asarray([[Indices[np.int(i)], Indices[np.int(j)],
-            kernel(Nodes[np.int(Indices[np.int(i)])],
-                   Nodes[np.int(Indices[np.int(j)])], sigma)]
+        weighted_edges = np.asarray([[Indices[int(i)], Indices[int(j)],
+            kernel(Nodes[int(Indices[int(i)])],
+                   Nodes[int(Indices[int(j)])], sigma)]
                    for [i, j] in edge_mat])
 
         # Add weights to graph
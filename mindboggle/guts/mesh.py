@@ -578,9 +578,17 @@ def keep_faces(faces, indices):
     """
     import numpy as np
 
-    fs = frozenset(indices)
-    faces = [lst for lst in faces if len(fs.intersection(lst)) == 3]
-    faces = np.reshape(np.ravel(faces), (-1, 3))
+    faces = np.reshape(np.asarray(faces, dtype=int), (-1, 3))
+    indices = np.asarray(indices, dtype=int)
+
+    # Flag retained vertices in a lookup table, then keep faces with three
+    # distinct retained vertices (a single vectorized pass over all faces):
+    nflags = max(faces.max(initial=-1), indices.max(initial=-1)) + 1
+    retained = np.zeros(nflags, dtype=bool)
+    retained[indices] = True
+    distinct = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & \
+               (faces[:, 0] != faces[:, 2])
+    faces = faces[retained[faces].all(axis=1) & distinct]
 
     #len_faces = len(faces)
     #if verbose and len(faces) < len_faces:
@@ -645,9 +653,9 @@ def reindex_faces_points(faces, points=[]):
     ...     points)
     >>> new_faces[0:3]
     [[277, 690, 276], [689, 691, 692], [690, 698, 699]]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in points[0]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in points[0]]
     [-13.7924, -76.0973, -2.57594]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in new_points[0]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in new_points[0]]
     [-13.7802, -12.3814, 57.4042]
 
     View reindexed fold on surface (skip test):
@@ -809,6 +817,7 @@ def decimate(points, faces, reduction=0.75, smooth_steps=25,
     """
     import os
     import vtk
+    from vtk.util.numpy_support import vtk_to_numpy
 
     # ------------------------------------------------------------------------
     # vtk points:
@@ -910,17 +919,17 @@ def decimate(points, faces, reduction=0.75, smooth_steps=25,
     # ------------------------------------------------------------------------
     # Extract decimated points, faces, and scalars:
     # ------------------------------------------------------------------------
-    points = [list(out.GetPoint(point_id))
-              for point_id in range(out.GetNumberOfPoints())]
+    # (read directly from VTK's buffers rather than one value at a time)
+    if out.GetNumberOfPoints() > 0:
+        points = vtk_to_numpy(out.GetPoints().GetData()).tolist()
+    else:
+        points = []
     if out.GetNumberOfPolys() > 0:
         polys = out.GetPolys()
         pt_data = out.GetPointData()
-        faces = [[int(polys.GetData().GetValue(j))
-                  for j in range(i*4 + 1, i*4 + 4)]
-                  for i in range(polys.GetNumberOfCells())]
+        faces = vtk_to_numpy(polys.GetData()).reshape(-1, 4)[:, 1:4].tolist()
         if scalars:
-            scalars = [pt_data.GetScalars().GetValue(i)
-                       for i in range(len(points))]
+            scalars = vtk_to_numpy(pt_data.GetScalars()).tolist()
     else:
         faces = []
         scalars = []
@@ -1180,19 +1189,17 @@ def rescale_by_label(input_vtk, labels_or_file, save_file=False,
         labels, name = read_scalars(labels_or_file, True, True)
     elif isinstance(labels_or_file, list):
         labels = labels_or_file
-    unique_labels = np.unique(labels)
-
-    # Loop through labels:
-    for label in unique_labels:
-        if verbose:
-            print("  Rescaling values within label {0} of {1} labels...".
-                format(int(label), len(unique_labels)))
-        indices = [i for i,x in enumerate(labels) if x == label]
-        if indices:
+    unique_labels, inverse = np.unique(labels, return_inverse=True)
+    inverse = inverse.ravel()
+    if verbose:
+        print("  Rescaling values within {0} labels...".
+            format(len(unique_labels)))
 
-            # Rescale by the maximum label scalar value:
-            scalars[indices] = scalars[indices] / np.max(scalars[indices])
-            #print(max(scalars), max(scalars[indices]))
+    # Rescale by the maximum scalar value of each label
+    # (per-label maxima gathered in a single pass):
+    max_per_label = np.full(len(unique_labels), -np.inf)
+    np.maximum.at(max_per_label, inverse, scalars)
+    scalars = scalars / max_per_label[inverse]
 
     rescaled_scalars = scalars.tolist()
 
@@ -1241,7 +1248,7 @@ def area_of_faces(points, faces):
     >>> input_vtk = fetch_data(urls['left_area'], '', '.vtk')
     >>> points, f1, f2, faces, f3, f4, f5, f6 = read_vtk(input_vtk)
     >>> area = area_of_faces(points, faces)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in area[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in area[0:5]]
     [0.21703, 0.27139, 0.29033, 0.1717, 0.36011]
 
     """
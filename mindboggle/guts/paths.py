@@ -71,7 +71,7 @@ def connect_points_erosion(S, neighbor_lists, outer_anchors, inner_anchors=[],
     >>> depths, name = read_scalars(depth_file, True, True)
     >>> folds, name = read_scalars(folds_file, True, True)
     >>> values = depths * curvs
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in values[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in values[0:5]]
     [-0.11778, -0.35642, -0.80759, -0.25654, -0.04411]
     >>> neighbor_lists = find_neighbors_from_file(curv_file)
     >>> background_value = -1
@@ -477,10 +477,9 @@ def connect_points_hmmf(indices_points, indices, L, neighbor_lists,
         N_array[0:N_sizes[index], index] = N[index]
     N_array_shape = np.shape(N_array)
     N_flat = np.ravel(N_array)
-    N_flat_list = N_flat.tolist()
-    H_N = np.reshape(H[[np.int(x) for x in N_flat_list]], N_array_shape)
-    ind_flat = [i for i,x in enumerate(N_flat_list) if x > 0]
-    len_flat = len(N_flat_list)
+    H_N = np.reshape(H[N_flat.astype(int)], N_array_shape)
+    ind_flat = np.flatnonzero(N_flat > 0)
+    len_flat = len(N_flat)
 
     # A zero in N calls H[0], so remove zero-padded neighborhood elements:
     Z = np.zeros((max_num_neighbors, len(L)))
@@ -507,7 +506,7 @@ def connect_points_hmmf(indices_points, indices, L, neighbor_lists,
         # Update neighborhood H values:
         #H_N = np.reshape(H[N_flat_list], N_array_shape)
         H_N = np.zeros(len_flat)
-        H_N[ind_flat] = H[[np.int(x) for x in N_flat[ind_flat]]]
+        H_N[ind_flat] = H[N_flat[ind_flat].astype(int)]
         H_N = np.reshape(H_N, N_array_shape)
 
         # Compute the cost gradient for the HMMF values:
@@ -678,7 +677,7 @@ def smooth_skeletons(skeletons, bounds, vtk_file, likelihoods, wN_max=1.0,
     >>> depths, name = read_scalars(depth_file, True, True)
     >>> vtk_file = curv_file
     >>> likelihoods = depths * curvs
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in likelihoods[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in likelihoods[0:5]]
     [-0.11778, -0.35642, -0.80759, -0.25654, -0.04411]
     >>> bounds, name = read_scalars(folds_file, True, True)
     >>> skeletons, name = read_scalars(fundus_file, True, True)
@@ -910,12 +909,15 @@ def track_segments(seed, segments, neighbor_lists, values, sink,
     >>> plot_surfaces('track_segments.vtk') # doctest: +SKIP
 
     """
-    import numpy as np
-
     if not sink:
         import sys
         sys.exit('Missing sink vertices.')
 
+    # (The neighborhoods searched below have only a handful of vertices,
+    # so their maxima are found with plain loops rather than with NumPy
+    # calls, whose overhead dominates on such short arrays.  A strict ">"
+    # keeps the first vertex with the maximum value, as np.argmax does.)
+    sink = frozenset(sink)
     track = [seed]
     for isegment, segment in enumerate(segments):
 
@@ -928,7 +930,10 @@ def track_segments(seed, segments, neighbor_lists, values, sink,
 
             # Add the neighborhood vertex with the maximum value to the track:
             if N_segment:
-                seed = N_segment[np.argmax(values[N_segment])]
+                seed = N_segment[0]
+                for x in N_segment[1:]:
+                    if values[x] > values[seed]:
+                        seed = x
                 track.append(seed)
 
                 # If the track has run into the region's border, return the track:
@@ -945,10 +950,14 @@ def track_segments(seed, segments, neighbor_lists, values, sink,
                 for Np in N_previous:
                     N_next = list(segment_set.intersection(neighbor_lists[Np]))
                     if N_next:
-                        if np.max(values[N_next]) > max_bridge:
-                            seed = N_next[np.argmax(values[N_next])]
+                        max_next = N_next[0]
+                        for x in N_next[1:]:
+                            if values[x] > values[max_next]:
+                                max_next = x
+                        if values[max_next] > max_bridge:
+                            seed = max_next
                             bridge = [Np, seed]
-                            max_bridge = np.max(values[N_next])
+                            max_bridge = values[max_next]
                 if bridge:
                     track.extend(bridge)
 
@@ -1073,17 +1082,26 @@ def find_outer_endpoints(indices, neighbor_lists, values, values_seeding,
     # ------------------------------------------------------------------------
     # Extract region boundary:
     # ------------------------------------------------------------------------
+    # (Only the region and its immediate neighbors can be on its boundary,
+    # so the rest of the mesh is not scanned.)
     B = np.ones(len(V))
     B[indices] = 2
-    borders, foo1, foo2 = extract_borders(list(range(len(B))), B,
+    near = np.zeros(len(V), dtype=bool)
+    near[indices] = True
+    near[[y for x in indices for y in neighbor_lists[x]]] = True
+    borders, foo1, foo2 = extract_borders(np.flatnonzero(near).tolist(), B,
                                           neighbor_lists)
 
     # ------------------------------------------------------------------------
     # Initialize seeds with vertices at the median-depth boundary:
     # ------------------------------------------------------------------------
+    # (The seeding values of the region are gathered once, so that each
+    # threshold is applied as a single vectorized comparison.)
+    indices_array = np.asarray(indices, dtype=int)
+    S_indices = S[indices_array]
     if do_threshold:
-        thresholdS = np.median(S[indices]) #+ np.std(S[indices])
-        indices_high = [x for x in indices if S[x] >= thresholdS]
+        thresholdS = np.median(S_indices) #+ np.std(S[indices])
+        indices_high = indices_array[S_indices >= thresholdS].tolist()
         # Make sure threshold is within the maximum values of the boundary:
         if list(frozenset(indices_high).intersection(borders)):
             do_threshold = False
@@ -1095,16 +1113,19 @@ def find_outer_endpoints(indices, neighbor_lists, values, values_seeding,
     # Or initialize seeds with vertices at the shrunken region boundary:
     # ------------------------------------------------------------------------
     if not do_threshold:
-        thresholdS = remove_fraction * np.max(S[indices])
+        thresholdS = remove_fraction * np.max(S_indices)
         if verbose:
             print('  Initialize seeds at {0:.2f} of fold depth'.
                 format(1-remove_fraction))
 
     # Extract threshold boundary vertices as seeds:
-    indices_high = [x for x in indices if S[x] >= thresholdS]
+    indices_high = indices_array[S_indices >= thresholdS].tolist()
     B = np.ones(len(S))
     B[indices_high] = 2
-    seeds, foo1, foo2 = extract_borders(list(range(len(S))), B,
+    near = np.zeros(len(S), dtype=bool)
+    near[indices_high] = True
+    near[[y for x in indices_high for y in neighbor_lists[x]]] = True
+    seeds, foo1, foo2 = extract_borders(np.flatnonzero(near).tolist(), B,
                                         neighbor_lists)
 
     # ------------------------------------------------------------------------
@@ -1244,7 +1265,7 @@ def find_max_values(points, values, min_separation=10, thr=0.5):
     >>> points, f1,f2,f3, curvs, f4,f5,f6 = read_vtk(curv_file, True,True)
     >>> depths, name = read_scalars(depth_file, True, True)
     >>> values = depths * curvs
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in values[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in values[0:5]]
     [-0.11778, -0.35642, -0.80759, -0.25654, -0.04411]
     >>> min_separation = 10
     >>> values0 = [x for x in values if x > 0]
@@ -1370,7 +1391,7 @@ def find_max_values(points, values, min_separation=10, thr=0.5):
 #     >>> seed
 #     65804
 #     >>> values = depths
-#     >>> [np.float("{0:.{1}f}".format(x, 5)) values[0:5]]
+#     >>> [float("{0:.{1}f}".format(x, 5)) values[0:5]]
 #     [0.02026, 0.06009, 0.12859, 0.04564, 0.00774]
 #     >>> sink = []
 #     >>> track = track_values(seed, indices, neighbor_lists, values, sink)
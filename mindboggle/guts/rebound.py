@@ -687,7 +687,7 @@ class Bounds:
         if verbose:
             print('The intersection points are: {0}'.format(intersection))
 
-        if np.product(intersection) < 0:
+        if np.prod(intersection) < 0:
             if verbose:
                 print(segment)
             labels = np.zeros(self.Labels.shape)
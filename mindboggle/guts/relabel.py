@@ -61,8 +61,8 @@ def relabel_volume(input_file, old_labels, new_labels, output_file=''):
 
     # Load labeled image volume and extract data as 1-D array
     vol = nb.load(input_file)
-    xfm = vol.get_affine()
-    data = vol.get_data().ravel()
+    xfm = vol.affine
+    data = np.asanyarray(vol.dataobj).ravel()
 
     # Initialize output
     new_data = data.copy()
@@ -146,8 +146,8 @@ def remove_volume_labels(input_file, labels_to_remove, output_file='',
     # Load labeled image volume and extract data as 1-D array:
     # ------------------------------------------------------------------------
     vol = nb.load(input_file)
-    xfm = vol.get_affine()
-    data = vol.get_data().ravel()
+    xfm = vol.affine
+    data = np.asanyarray(vol.dataobj).ravel()
 
     # ------------------------------------------------------------------------
     # If second file specified, erase voxels whose corresponding
@@ -156,8 +156,8 @@ def remove_volume_labels(input_file, labels_to_remove, output_file='',
     if second_file:
         # Load second image volume and extract data as 1-D array:
         vol = nb.load(second_file)
-        xfm = vol.get_affine()
-        new_data = vol.get_data().ravel()
+        xfm = vol.affine
+        new_data = np.asanyarray(vol.dataobj).ravel()
         if not output_file:
             output_file = os.path.join(os.getcwd(),
                                        os.path.basename(second_file))
@@ -247,8 +247,8 @@ def keep_volume_labels(input_file, labels_to_keep, output_file='',
     # Load labeled image volume and extract data as 1-D array:
     # ------------------------------------------------------------------------
     vol = nb.load(input_file)
-    xfm = vol.get_affine()
-    data = vol.get_data().ravel()
+    xfm = vol.affine
+    data = np.asanyarray(vol.dataobj).ravel()
 
     # ------------------------------------------------------------------------
     # If second file specified, erase voxels whose corresponding
@@ -257,8 +257,8 @@ def keep_volume_labels(input_file, labels_to_keep, output_file='',
     if second_file:
         # Load second image volume and extract data as 1-D array:
         vol = nb.load(second_file)
-        xfm = vol.get_affine()
-        new_data = vol.get_data().ravel()
+        xfm = vol.affine
+        new_data = np.asanyarray(vol.dataobj).ravel()
         if not output_file:
             output_file = os.path.join(os.getcwd(),
                                        os.path.basename(second_file))
@@ -484,9 +484,9 @@ def overwrite_volume_labels(source, target, output_file='', ignore_labels=[0],
     if vol_source.shape != vol_target.shape:
         raise IOError('{0} and {1} need to be the same shape.'.
                       format(source, target))
-    xfm = vol_target.get_affine()
-    data_source = vol_source.get_data().ravel()
-    data_target = vol_target.get_data().ravel()
+    xfm = vol_target.affine
+    data_source = np.asanyarray(vol_source.dataobj).ravel()
+    data_target = np.asanyarray(vol_target.dataobj).ravel()
 
     # Initialize output:
     new_data = data_target.copy()
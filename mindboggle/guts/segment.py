@@ -336,12 +336,23 @@ def segment_regions(vertices_to_segment, neighbor_lists, min_region_size=1,
     # ------------------------------------------------------------------------
     segments = background_value * np.ones(len(neighbor_lists))
     region_lists = [[] for x in seed_lists]
-    all_regions = []
     fully_grown = [False for x in seed_lists]
     new_segment_index = 0
     counter = 0
     if isinstance(max_steps, str):
-        max_steps = np.Inf
+        max_steps = np.inf
+
+    # ------------------------------------------------------------------------
+    # Boolean masks of vertices still to segment and of vertices already in
+    # a region, so that set differences and membership tests cost O(1) per
+    # vertex instead of a pass over all (segmented) vertices at each step.
+    # The (ordered) list of vertices to segment is only kept up to date
+    # when new single seeds are drawn from it:
+    # ------------------------------------------------------------------------
+    to_segment = np.zeros(len(neighbor_lists), dtype=bool)
+    to_segment[vertices_to_segment] = True
+    in_regions = np.zeros(len(neighbor_lists), dtype=bool)
+    keep_list = select_single_seed or keep_seeding
 
     # ------------------------------------------------------------------------
     # If label_lists empty, set to unique labels for each seed list:
@@ -368,13 +379,15 @@ def segment_regions(vertices_to_segment, neighbor_lists, min_region_size=1,
 
                 # Add seeds to region:
                 region_lists[ilist].extend(seed_list)
-                all_regions.extend(seed_list)
+                in_regions[seed_list] = True
 
                 # Remove seeds from vertices to segment:
-                vertices_to_segment = list(frozenset(vertices_to_segment).
-                difference(seed_list))
+                to_segment[seed_list] = False
+                if keep_list:
+                    vertices_to_segment = list(frozenset(vertices_to_segment).
+                    difference(seed_list))
 
-                if vertices_to_segment:
+                if to_segment.any():
 
                     # Find neighbors of each seed with lower values than the seed:
                     if values:
@@ -392,8 +405,8 @@ def segment_regions(vertices_to_segment, neighbor_lists, min_region_size=1,
 
                     # Select neighbors that have not been previously selected
                     # and are among the vertices to segment:
-                    seed_list = list(frozenset(neighbors).intersection(vertices_to_segment))
-                    seed_list = list(frozenset(seed_list).difference(all_regions))
+                    seed_list = [x for x in frozenset(neighbors)
+                                 if to_segment[x] and not in_regions[x]]
 
                 else:
                     seed_list = []
@@ -430,13 +443,14 @@ def segment_regions(vertices_to_segment, neighbor_lists, min_region_size=1,
 
                         # Display current number and size of region:
                         if verbose and size_region > 1:
-                            if len(seed_lists) == 1 and vertices_to_segment:
+                            nremain = np.sum(to_segment)
+                            if len(seed_lists) == 1 and nremain:
                                 print("      {0} vertices remain".
-                                      format(len(vertices_to_segment)))
+                                      format(nremain))
                             else:
                                 print("      Region {0}: {1} vertices ({2} remain)".
                                       format(int(new_segment_index), size_region,
-                                             len(vertices_to_segment)))
+                                             nremain))
 
                     # If selecting a single seed, continue growing
                     # if there are more vertices to segment:
@@ -464,9 +478,10 @@ def segment_regions(vertices_to_segment, neighbor_lists, min_region_size=1,
 
             # Add seeds to region:
             region.extend(seed_list)
-            all_regions.extend(seed_list)
+            in_regions[seed_list] = True
 
             # Remove seeds from vertices to segment:
+            to_segment[seed_list] = False
             vertices_to_segment = list(frozenset(vertices_to_segment).
             difference(seed_list))
             if vertices_to_segment:
@@ -477,8 +492,8 @@ def segment_regions(vertices_to_segment, neighbor_lists, min_region_size=1,
 
                 # Select neighbors that have not been previously selected
                 # and are among the vertices to segment:
-                seed_list = list(frozenset(vertices_to_segment).intersection(neighbors))
-                seed_list = list(frozenset(seed_list).difference(all_regions))
+                seed_list = [x for x in frozenset(neighbors)
+                             if to_segment[x] and not in_regions[x]]
             else:
                 seed_list = []
 
@@ -869,6 +884,7 @@ def segment_rings(region, seeds, neighbor_lists, step=1, background_value=-1,
     >>> plot_surfaces('segment_rings.vtk') # doctest: +SKIP
 
     """
+    import numpy as np
     from mindboggle.guts.segment import segment_regions
 
     segments = []
@@ -879,17 +895,17 @@ def segment_rings(region, seeds, neighbor_lists, step=1, background_value=-1,
                                          False, False, [], [], [],
                                          step, background_value, verbose)
 
-        seeds_plus_new = [i for i,x in enumerate(seeds_plus_new)
-                          if x != background_value]
+        seeds_plus_new = np.flatnonzero(seeds_plus_new != background_value)
 
         # Store the new segment after removing the previous segment:
-        region = list(frozenset(region).difference(seeds))
-        seeds = list(frozenset(seeds_plus_new).difference(seeds))
+        seeds = list(frozenset(seeds_plus_new.tolist()).difference(seeds))
         if seeds:
 
-            # Add the new segment and remove it from the region:
+            # Add the new segment and remove it (and the previous segment)
+            # from the region, with a sorted set difference in NumPy:
             segments.append(seeds)
-            region = list(frozenset(region).difference(seeds))
+            region = np.setdiff1d(region, seeds_plus_new,
+                                  assume_unique=True).tolist()
 
     return segments
 
@@ -989,6 +1005,16 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
     >>> len_segments[0:10]
     [2976, 4092, 597, 1338, 1419, 1200, 1641, 220, 1423, 182]
 
+    Of vertices with tied depths, the first in indices seeds a basin first:
+
+    >>> depths = np.array([1., 2., 1., 0.5, 1., 2., 1.])
+    >>> points = [[float(i), 0., 0.] for i in range(7)]
+    >>> neighbor_lists = [[1], [0, 2], [1, 3], [2, 4], [3, 5], [4, 6], [5]]
+    >>> watershed(depths, points, [0, 1, 2, 3, 4, 5, 6], neighbor_lists)[1]
+    [1, 5]
+    >>> watershed(depths, points, [6, 5, 4, 3, 2, 1, 0], neighbor_lists)[1]
+    [5, 1]
+
     Write watershed segments and seeds to vtk file and view (skip test).
     Note: white spots indicate incomplete segmentation:
 
@@ -1022,20 +1048,35 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
     t0 = time()
     tiny = 0.000001
 
-    use_depth_ratio = True
-
     # ------------------------------------------------------------------------
     # Find the borders of the given mesh vertices (indices):
     # ------------------------------------------------------------------------
+    # (Only the vertices and their immediate neighbors can be on the
+    # borders, so the rest of the mesh is not scanned.)
     D = np.ones(len(depths))
     D[indices] = 2
-    borders, foo1, foo2 = extract_borders(list(range(len(depths))), D,
+    near = np.zeros(len(depths), dtype=bool)
+    near[indices] = True
+    near[[y for x in indices for y in neighbor_lists[x]]] = True
+    borders, foo1, foo2 = extract_borders(np.flatnonzero(near).tolist(), D,
         neighbor_lists, ignore_values=[], return_label_pairs=False)
 
     # ------------------------------------------------------------------------
-    # Select deepest vertex as initial seed:
+    # Select deepest vertex as initial seed.  Vertices are sorted by
+    # decreasing depth once, so that each new seed (the deepest unsegmented
+    # vertex) is found by advancing past segmented vertices in this order,
+    # rather than by searching all remaining vertices for every basin.
+    # The sort is stable, so ties in depth are broken by order in indices.
+    # (Earlier, only the first seed was chosen this way: later seeds came
+    # from a set of the remaining vertices, so where depths tie, their
+    # selection, and so the basins, can differ from before.)
     # ------------------------------------------------------------------------
-    index_deepest = indices[np.argmax(depths[indices])]
+    depth_order = np.asarray(indices, dtype=int)[
+        np.argsort(-depths[indices], kind='stable')]
+    unsegmented = np.zeros(len(depths), dtype=bool)
+    unsegmented[indices] = True
+    ideepest = 0
+    index_deepest = int(depth_order[ideepest])
     seed_list = [index_deepest]
     basin_depths = []
     original_indices = indices[:]
@@ -1044,10 +1085,14 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
     # Loop until all vertices have been segmented.
     # This limits the number of possible seeds:
     # ------------------------------------------------------------------------
+    # (Vertices to segment and vertices already in a region are tracked
+    # with boolean masks and a count, so that set differences and
+    # membership tests do not pass over all vertices at every step.)
     segments = background_value * np.ones(len(depths))
     seed_indices = []
     seed_points = []
-    all_regions = []
+    in_regions = np.zeros(len(depths), dtype=bool)
+    nunsegmented = np.count_nonzero(unsegmented)
     region = []
     counter = 0
     terminate = False
@@ -1055,11 +1100,12 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
 
         # Add seeds to region:
         region.extend(seed_list)
-        all_regions.extend(seed_list)
+        in_regions[seed_list] = True
 
         # Remove seeds from vertices to segment:
-        indices = list(frozenset(indices).difference(seed_list))
-        if indices:
+        nunsegmented -= np.count_nonzero(unsegmented[seed_list])
+        unsegmented[seed_list] = False
+        if nunsegmented:
 
             # Identify neighbors of seeds:
             neighbors = []
@@ -1068,8 +1114,8 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
             # Select neighbors that have not been previously selected
             # and are among the vertices to segment:
             old_seed_list = seed_list[:]
-            seed_list = list(frozenset(neighbors).intersection(indices))
-            seed_list = list(frozenset(seed_list).difference(all_regions))
+            seed_list = [x for x in frozenset(neighbors)
+                         if unsegmented[x] and not in_regions[x]]
 
             # For each vertex, select neighbors that are shallower:
             seed_neighbors = []
@@ -1099,23 +1145,25 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
                 basin_depths.append(max_depth)
 
             # If vertices left to segment, re-initialize parameters:
-            if indices:
+            if nunsegmented:
 
                 # Initialize new region/basin:
                 region = []
 
                 # Select deepest unsegmented vertex as new seed
                 # if its rescaled depth is close to 1:
-                index_deepest = indices[np.argmax(depths[indices])]
+                while not unsegmented[depth_order[ideepest]]:
+                    ideepest += 1
+                index_deepest = int(depth_order[ideepest])
                 seed_list = [index_deepest]
 
             # Termination criteria:
-            if not len(indices):
+            if not nunsegmented:
                 terminate = True
 
             # Display current number and size of region:
             if verbose2:
-                print("    {0} vertices remain".format(len(indices)))
+                print("    {0} vertices remain".format(nunsegmented))
 
     if verbose:
         print('  ...Segmented {0} initial watershed regions ({1:.2f} seconds)'.
@@ -1129,9 +1177,12 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
         if verbose:
             print('  Regrow segments from watershed seeds, '
                   'stopping at borders')
-        indices = original_indices[:]
+        unsegmented[original_indices] = True
+        nunsegmented = np.count_nonzero(unsegmented)
+        is_border = np.zeros(len(depths), dtype=bool)
+        is_border[borders] = True
         segments = background_value * np.ones(len(depths))
-        all_regions = []
+        in_regions[:] = False
         for iseed, seed_index in enumerate(seed_indices):
             seed_list = [seed_index]
             region = []
@@ -1140,11 +1191,12 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
 
                 # Add seeds to region:
                 region.extend(seed_list)
-                all_regions.extend(seed_list)
+                in_regions[seed_list] = True
 
                 # Remove seeds from vertices to segment:
-                indices = list(frozenset(indices).difference(seed_list))
-                if indices:
+                nunsegmented -= np.count_nonzero(unsegmented[seed_list])
+                unsegmented[seed_list] = False
+                if nunsegmented:
 
                     # Identify neighbors of seeds:
                     neighbors = []
@@ -1153,8 +1205,8 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
                     # Select neighbors that have not been previously selected
                     # and are among the vertices to segment:
                     old_seed_list = seed_list[:]
-                    seed_list = list(frozenset(neighbors).intersection(indices))
-                    seed_list = list(frozenset(seed_list).difference(all_regions))
+                    seed_list = [x for x in frozenset(neighbors)
+                                 if unsegmented[x] and not in_regions[x]]
 
                     # For each vertex, select neighbors that are shallower:
                     seed_neighbors = []
@@ -1165,7 +1217,7 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
 
                     # Remove seed list if it contains a border vertex:
                     if seed_list:
-                        if list(frozenset(seed_list).intersection(borders)):
+                        if is_border[seed_list].any():
                             seed_list = []
                 else:
                     seed_list = []
@@ -1180,15 +1232,16 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
 
                     # Display current number and size of region:
                     if verbose2:
-                        print("    {0} vertices remain".format(len(indices)))
+                        print("    {0} vertices remain".format(nunsegmented))
 
         # --------------------------------------------------------------------
         # Continue growth until there are no more vertices to segment:
         # --------------------------------------------------------------------
         # Note: As long as keep_seeding=False, the segment values in `segments`
         # are equal to the order of the `basin_depths` and `seed_points` below.
-        seed_lists = [[i for i,x in enumerate(segments) if x==s]
+        seed_lists = [np.flatnonzero(segments == s).tolist()
                       for s in np.unique(segments) if s != background_value]
+        indices = np.flatnonzero(unsegmented).tolist()
         segments = segment_regions(indices, neighbor_lists, 1, seed_lists,
                                    False, False, [], [], [], '',
                                    background_value, False)
@@ -1227,16 +1280,10 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
 
                 # Store neighbors whose depth is less than a fraction of the
                 # basin's depth and farther away than half the basin's depth:
-                if use_depth_ratio:
-                    index_neighbors = [[x, index] for x in index_neighbors
-                        if basin_depths[x] / (basin_depths[index]+tiny) < depth_ratio
-                        if point_distance(seed_points[x], [seed_points[index]])[0] >
-                          depth_factor * max([basin_depths[x], basin_depths[index]])]
-                # Store neighbors farther away than half the basin's depth:
-                else:
-                    index_neighbors = [[x, index] for x in index_neighbors
-                        if point_distance(seed_points[x], [seed_points[index]])[0] >
-                        depth_factor * max([basin_depths[x], basin_depths[index]])]
+                index_neighbors = [[x, index] for x in index_neighbors
+                    if basin_depths[x] / (basin_depths[index]+tiny) < depth_ratio
+                    if point_distance(seed_points[x], [seed_points[index]])[0] >
+                      depth_factor * max([basin_depths[x], basin_depths[index]])]
                 if index_neighbors:
                     basin_pairs.extend(index_neighbors)
 
@@ -1252,8 +1299,7 @@ def watershed(depths, points, indices, neighbor_lists, min_size=1,
         segment_numbers = [int(x) for x in np.unique(segments)
                            if x != background_value]
         for i_segment, n_segment in enumerate(segment_numbers):
-            segment = [i for i,x in enumerate(segments) if x == n_segment]
-            renumber_segments[segment] = i_segment
+            renumber_segments[segments == n_segment] = i_segment
         segments = renumber_segments
 
         # Print statement:
@@ -1351,10 +1397,10 @@ def select_largest(points, faces, exclude_labels=[-1], areas=None,
 
     """
     import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
 
-    from mindboggle.guts.mesh import find_neighbors, keep_faces, \
-        reindex_faces_points
-    from mindboggle.guts.segment import segment_regions
+    from mindboggle.guts.mesh import keep_faces, reindex_faces_points
 
     # Areas:
     use_area = False
@@ -1375,18 +1421,25 @@ def select_largest(points, faces, exclude_labels=[-1], areas=None,
     else:
 
         # --------------------------------------------------------------------
-        # Segment the indices into connected sets of indices:
+        # Segment the indices into connected sets of indices
+        # (connected components of the graph of face edges):
         # --------------------------------------------------------------------
-        # Construct neighbor lists:
-        neighbor_lists = find_neighbors(faces, npoints)
+        # Construct a sparse adjacency matrix from the edges of the faces:
+        faces_array = np.asarray(faces)
+        edges_from = np.ravel(faces_array)
+        edges_to = np.ravel(np.roll(faces_array, -1, axis=1))
+        adjacency = csr_matrix((np.ones(len(edges_from), dtype=int),
+                                (edges_from, edges_to)),
+                               shape=(npoints, npoints))
 
         # Determine the unique indices that make up the faces:
-        indices = np.unique(np.ravel(faces))
+        indices = np.unique(edges_from)
 
         # Segment:
-        segments = segment_regions(indices, neighbor_lists, 1, [], False,
-                                   False, [], [], [], '', background_value,
-                                   verbose)
+        ncomponents, components = connected_components(adjacency,
+                                                       directed=False)
+        segments = background_value * np.ones(npoints)
+        segments[indices] = components[indices]
 
         # --------------------------------------------------------------------
         # Select the largest segment (connected set of indices):
@@ -1397,8 +1450,8 @@ def select_largest(points, faces, exclude_labels=[-1], areas=None,
             select_indices = []
             max_segment_area = 0
             for segment_number in unique_segments:
-                segment_indices = [i for i,x in enumerate(segments)
-                                   if x == segment_number]
+                segment_indices = np.flatnonzero(segments ==
+                                                 segment_number).tolist()
                 if use_area:
                     segment_area = np.sum(areas[segment_indices])
                 else:
@@ -1489,6 +1542,12 @@ def extract_borders(indices, labels, neighbor_lists,
     >>> ubLT
     [[20, 30, 40], [20, 30], [30, 40], [50, 80], [40, 50, 90]]
 
+    Ignore borders with background (-1) vertices, without label pairs:
+
+    >>> labels = [10, 20, 30, -1, 50, 60, 70, 80, 90, 100, -1, -1]
+    >>> extract_borders(indices, labels, neighbor_lists, [-1], False)
+    ([1, 4], [], [])
+
     Real example -- extract sulcus label boundaries:
 
     >>> import numpy as np
@@ -1533,34 +1592,46 @@ def extract_borders(indices, labels, neighbor_lists,
     if not isinstance(labels, np.ndarray):
         labels = np.array(labels)
 
-    # Construct an array of labels corresponding to the neighbor lists:
-    L = np.array([list(set(labels[lst])) for lst in neighbor_lists])
-
-    # Find indices to sets of two labels:
-    border_indices = [indices[y] for y in
-                      [i for i,x in enumerate(L[indices])
-                       if len(set(x)) >= 2]]
-
-    if return_label_pairs:
-        border_label_tuples = [np.sort(L[indices[j]]).tolist() for j in
-                                [i for i,x in enumerate(L[indices])
-                                 if len(set(x)) >= 2]]
+    # Gather the neighbors of the given vertices into one flat array
+    # with row offsets (compressed sparse row layout), so that the labels
+    # of all neighbors can be looked up and compared in single operations:
+    rows = [neighbor_lists[x] for x in indices]
+    counts = np.array([len(x) for x in rows], dtype=int)
+    flat = np.fromiter((y for x in rows for y in x), dtype=int,
+                       count=np.sum(counts))
+    flat_labels = labels[flat]
+
+    # Find indices to vertices whose neighbors have two or more labels
+    # (the minimum and maximum neighbor label differ):
+    is_border = np.zeros(len(rows), dtype=bool)
+    nonempty = np.flatnonzero(counts)
+    if nonempty.size:
+        starts = np.cumsum(counts)[nonempty] - counts[nonempty]
+        is_border[nonempty] = np.minimum.reduceat(flat_labels, starts) != \
+                              np.maximum.reduceat(flat_labels, starts)
+    Iborder = np.flatnonzero(is_border)
+    border_indices = [indices[i] for i in Iborder]
+
+    if return_label_pairs or ignore_values:
+        border_label_tuples = [np.unique(labels[neighbor_lists[indices[i]]]).
+                               tolist() for i in Iborder]
     else:
         border_label_tuples = []
 
     if ignore_values:
         Ikeep = [i for i,x in enumerate(border_label_tuples)
                  if not len(set(x).intersection(ignore_values))]
-        border_indices = [x for i,x in enumerate(border_indices)
-                            if i in Ikeep]
-        if return_label_pairs:
-            border_label_tuples = [x for i,x in enumerate(border_label_tuples)
-                                    if i in Ikeep]
+        border_indices = [border_indices[i] for i in Ikeep]
+        border_label_tuples = [border_label_tuples[i] for i in Ikeep]
+    if not return_label_pairs:
+        border_label_tuples = []
 
     if return_label_pairs:
         unique_border_label_tuples = []
+        seen = set()
         for pair in border_label_tuples:
-            if pair not in unique_border_label_tuples:
+            if tuple(pair) not in seen:
+                seen.add(tuple(pair))
                 unique_border_label_tuples.append(pair)
     else:
         unique_border_label_tuples = []
@@ -1607,7 +1678,7 @@ def extract_borders_2nd_surface(labels_file, values_file='',
     >>> output_file = 'extract_borders_2nd_surface.vtk'
     >>> border_file, values, I = extract_borders_2nd_surface(label_file,
     ...     values_file, output_file, background_value)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in np.unique(values)[0:8]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in np.unique(values)[0:8]]
     [-1.0, 0.0, 0.00012, 0.00023, 0.00032, 0.00044, 0.00047, 0.00051]
     >>> I[0:10]
     [115, 116, 120, 121, 125, 126, 130, 131, 281, 286]
@@ -1736,27 +1807,27 @@ def combine_2labels_in_2volumes(file1, file2, label1=3, label2=2,
     # ------------------------------------------------------------------------
     vol1 = nb.load(file1)
     vol2 = nb.load(file2)
-    data1 = vol1.get_data().ravel()
-    data2 = vol2.get_data().ravel()
-    xfm = vol1.get_affine()
+    data1 = np.asanyarray(vol1.dataobj).ravel()
+    data2 = np.asanyarray(vol2.dataobj).ravel()
+    xfm = vol1.affine
     # ------------------------------------------------------------------------
-    # Indices to voxels with label1 or label2 in two files:
+    # Masks of voxels with label1 or label2 in either of the two files:
     # ------------------------------------------------------------------------
     label1 = int(label1)
     label2 = int(label2)
-    Ilabel1_vol1 = np.where(data1 == label1)[0]
-    Ilabel1_vol2 = np.where(data2 == label1)[0]
-    Ilabel2_vol1 = np.where(data1 == label2)[0]
-    Ilabel2_vol2 = np.where(data2 == label2)[0]
-    Ilabel1 = Ilabel1_vol1.tolist() + Ilabel1_vol2.tolist()
-    Ilabel2 = Ilabel2_vol1.tolist() + Ilabel2_vol2.tolist()
+    label1_mask = (data1 == label1) | (data2 == label1)
+    label2_mask = (data1 == label2) | (data2 == label2)
     # ------------------------------------------------------------------------
     # Assign new labels and reshape to original dimensions:
     # ------------------------------------------------------------------------
     new_data = data1.copy()
-    new_data[Ilabel2] = label2
-    new_data[Ilabel1] = label1
+    new_data[label2_mask] = label2
+    new_data[label1_mask] = label1
     new_data = np.reshape(new_data, vol1.shape)
+    # Store segmentation labels as one byte per voxel if they fit:
+    narrow_data = new_data.astype(np.uint8)
+    if np.array_equal(narrow_data, new_data):
+        new_data = narrow_data
     # ------------------------------------------------------------------------
     # Save relabeled file:
     # ------------------------------------------------------------------------
@@ -1835,12 +1906,12 @@ def split_brain(image_file, label_file, left_labels, right_labels):
     vol = nb.load(image_file)
     volL = nb.load(left_brain)
     volR = nb.load(right_brain)
-    data = vol.get_data().ravel()
-    dataL = volL.get_data().ravel()
-    dataR = volR.get_data().ravel()
+    data = np.asanyarray(vol.dataobj).ravel()
+    dataL = np.asanyarray(volL.dataobj).ravel()
+    dataR = np.asanyarray(volR.dataobj).ravel()
     dataL[np.where(dataL != 0)[0]] = 1
     dataR[np.where(dataR != 0)[0]] = 1
-    xfm = vol.get_affine()
+    xfm = vol.affine
     # ------------------------------------------------------------------------
     # Split brain image by masking with left or right labels:
     # ------------------------------------------------------------------------
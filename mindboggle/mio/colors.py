@@ -265,7 +265,7 @@ def label_adjacency_matrix(label_file, ignore_values=[-1, 999], add_value=0,
     # Use scipy to dilate volume files to find neighboring labels:
     elif label_file.endswith('.nii.gz'):
 
-        L = load(label_file).get_data()
+        L = np.asanyarray(load(label_file).dataobj)
         unique_volume_labels = np.unique(L)
 
         label_pairs = []
@@ -857,12 +857,11 @@ def write_json_colormap(colormap, label_numbers, label_names=[],
     if not colormap_name:
         colormap_name = 'Colormap'
 
-    f = open(colormap_file, 'w', encoding='utf-8')
-    f.write("{\n")
-    f.write('    "name": "{0}",\n'.format(colormap_name))
-    f.write('    "description": "{0}",\n'.format(description))
-    f.write('    "colormap": [\n')
-
+    # Assemble the file's lines and write them with a single call:
+    lines = ["{\n",
+             '    "name": "{0}",\n'.format(colormap_name),
+             '    "description": "{0}",\n'.format(description),
+             '    "colormap": [\n']
 
     for icolor, color in enumerate(colormap):
 
@@ -871,12 +870,14 @@ def write_json_colormap(colormap, label_numbers, label_names=[],
         else:
             end_comma = ','
 
-        f.write('    {0}"ID": "{1}", "name": "{2}", '
-                '"red": "{3}", "green": "{4}", "blue": "{5}"{6}{7}\n'.
-                format("{", label_numbers[icolor], label_names[icolor],
-                       color[0], color[1], color[2], "}", end_comma))
-    f.write(']}')
-    f.close()
+        lines.append('    {0}"ID": "{1}", "name": "{2}", '
+                     '"red": "{3}", "green": "{4}", "blue": "{5}"{6}{7}\n'.
+                     format("{", label_numbers[icolor], label_names[icolor],
+                            color[0], color[1], color[2], "}", end_comma))
+    lines.append(']}')
+
+    with open(colormap_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(lines))
 
 
 def write_xml_colormap(colormap, label_numbers, colormap_file='',
@@ -917,21 +918,23 @@ def write_xml_colormap(colormap, label_numbers, colormap_file='',
     if not colormap_name:
         colormap_name = 'Colormap'
 
-    f = open(colormap_file, 'w', encoding='utf-8')
-    f.write('''
+    # Assemble the file's lines and write them with a single call:
+    lines = ['''
 <ColorMap name="{0}" space="RGB">
     <NaN r="0" g="0" b="0"/>
     <Point x="-1" o="0"  r="0" g="0" b="0"/>
-'''.format(colormap_name))
+'''.format(colormap_name)]
 
     for icolor, color in enumerate(colormap):
-        f.write('''    <Point x="{0}" o="1" r="{1}" g="{2}" b="{3}"/>
+        lines.append('''    <Point x="{0}" o="1" r="{1}" g="{2}" b="{3}"/>
         '''.format(label_numbers[icolor], color[0], color[1], color[2]))
 
-    f.write('''
+    lines.append('''
 </ColorMap>
 ''')
-    f.close()
+
+    with open(colormap_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(lines))
 
 def viridis_colormap():
     """
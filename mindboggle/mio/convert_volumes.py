@@ -81,30 +81,34 @@ def convert2nii(input_file, reference_file, output_file='', interp='continuous')
     # Resample the source image according to the reference image:
     # ------------------------------------------------------------------------
     vol1 = nb.load(input_file)
-    dat1 = vol1.get_data()
+    dat1 = np.asanyarray(vol1.dataobj)
     xfm1 = vol1.affine
-    if np.all(xfm2 == xfm1):
-        transform_affine = np.eye(4)
+    if np.all(xfm2 == xfm1) and dat1.shape == dim2:
+        # Same voxel grid, so there is nothing to resample:
+        resliced = dat1
     else:
-        transform_affine = np.dot(linalg.inv(xfm1), xfm2)
-    A = transform_affine[0:3, 0:3]
-    b = transform_affine[0:3, 3]
-    A_inv = linalg.inv(A)
-    # If A is diagonal, affine_transform uses a better algorithm.
-    if np.all(np.diag(np.diag(A)) == A):
-        A = np.diag(A)
-    else:
-        b = np.dot(A, b)
-
-    # order of the spline interpolation:
-    if interp == 'nearest':
-        interpolation_order = 0
-    else:
-        interpolation_order = 3
-    resliced = ndimage.affine_transform(dat1, A,
-                         offset=np.dot(A_inv, b),
-                         output_shape=dim2,
-                         order=interpolation_order)
+        if np.all(xfm2 == xfm1):
+            transform_affine = np.eye(4)
+        else:
+            transform_affine = np.dot(linalg.inv(xfm1), xfm2)
+        A = transform_affine[0:3, 0:3]
+        b = transform_affine[0:3, 3]
+        A_inv = linalg.inv(A)
+        # If A is diagonal, affine_transform uses a better algorithm.
+        if np.all(np.diag(np.diag(A)) == A):
+            A = np.diag(A)
+        else:
+            b = np.dot(A, b)
+
+        # order of the spline interpolation:
+        if interp == 'nearest':
+            interpolation_order = 0
+        else:
+            interpolation_order = 3
+        resliced = ndimage.affine_transform(dat1, A,
+                             offset=np.dot(A_inv, b),
+                             output_shape=dim2,
+                             order=interpolation_order)
 
     # ------------------------------------------------------------------------
     # Save the image with the reference affine transform:
@@ -350,7 +350,7 @@ def histograms_of_lists(columns, column_name='', ignore_columns=[],
     for icolumn, column in enumerate(columns):
         if icolumn not in ignore_columns:
             ax = fig.add_subplot(nplotrows, nplotcols, icolumn + 1)
-            column = [np.float(x) for x in column]
+            column = [float(x) for x in column]
             ax.hist(column, bins=nbins, density=False, facecolor='gray', alpha=0.5)
             plt.xlabel(column_name, fontsize='small')
             if len(titles) == ncolumns:
@@ -478,7 +478,7 @@ def scatterplot_lists(y_columns, x_column, ignore_columns=[], plot_line=True,
         min_value = np.inf
         max_value = -np.inf
     for icolumn, column in enumerate(y_columns):
-        column = [np.float(x) for x in column]
+        column = [float(x) for x in column]
         if icolumn not in ignore_columns:
             color = next(colors)
             #color = colors[icolumn]
@@ -610,8 +610,8 @@ def scatterplot_list_pairs(columns, ignore_first_column=False, plot_line=True,
         limit = np.ceil(np.max([np.max(columns1), np.max(columns1)]))
     for icolumn, column1 in enumerate(columns1):
         column2 = columns2[icolumn]
-        column1 = [np.float(x) for x in column1]
-        column2 = [np.float(x) for x in column2]
+        column1 = [float(x) for x in column1]
+        column2 = [float(x) for x in column2]
         if mcolor:
             color = mcolor
         else:
@@ -693,7 +693,7 @@ if __name__ == "__main__":
 #     for row in f1:
 #         row = row.split()
 #         for icolumn, column in enumerate(row):
-#             columns[icolumn].append(np.float(column))
+#             columns[icolumn].append(float(column))
 #     columns1 = [columns[0]]
 #     for i in range(1, len(columns)):
 #         if np.mod(i,2) == 1:
@@ -726,7 +726,7 @@ if __name__ == "__main__":
 #     if box_per_label:
 #         rows1 = []
 #         for row in f1:
-#             rows1.append([np.float(x) for x in row.split()[1::]])
+#             rows1.append([float(x) for x in row.split()[1::]])
 #         xlabel = 'label index'
 #         ylabel = 'thickness (mm)'
 #         ylimit = 6.5
@@ -143,6 +143,7 @@ def write_shape_stats(labels_or_file=[], sulci=[], fundi=[],
     import os
     import numpy as np
     import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
 
     from mindboggle.guts.compute import stats_per_label
     from mindboggle.guts.compute import means_per_label
@@ -197,26 +198,35 @@ def write_shape_stats(labels_or_file=[], sulci=[], fundi=[],
     first_pass = True
     area_array = []
 
-    for ishape, shape_file in enumerate(shape_files):
-        if os.path.exists(shape_file):
-            if first_pass:
-                points, indices, lines, faces, scalars_array, scalar_names, \
-                    npoints, input_vtk = read_vtk(shape_file, True, True)
-                points = np.array(points)
-                first_pass = False
-                if affine_transform_files and transform_format:
-                    affine_points, \
-                        foo1 = apply_affine_transforms(affine_transform_files,
-                                    inverse_booleans, transform_format,
-                                    points, vtk_file_stem='')
-            else:
-                scalars_array, name = read_scalars(shape_file, True, True)
-            if scalars_array.size:
-                shape_arrays.append(scalars_array)
+    # Points are read from the first shape file found; scalars of the
+    # remaining shape files are read in background threads meanwhile
+    # (overlapping with the point transform below):
+    found_files = [x for x in shape_files if os.path.exists(x)]
+    with ThreadPoolExecutor(max_workers=max(len(found_files) - 1, 1)) \
+            as executor:
+        found_scalars = dict((x, executor.submit(read_scalars, x, True, True))
+                             for x in found_files[1:])
+
+        for ishape, shape_file in enumerate(shape_files):
+            if os.path.exists(shape_file):
+                if first_pass:
+                    points, indices, lines, faces, scalars_array, \
+                        scalar_names, npoints, input_vtk = read_vtk(
+                            shape_file, True, True, return_arrays=True)
+                    first_pass = False
+                    if affine_transform_files and transform_format:
+                        affine_points, \
+                            foo1 = apply_affine_transforms(
+                                affine_transform_files, inverse_booleans,
+                                transform_format, points, vtk_file_stem='')
+                else:
+                    scalars_array, name = found_scalars[shape_file].result()
+                if scalars_array.size:
+                    shape_arrays.append(scalars_array)
 
-                # Store area array:
-                if ishape == 0:
-                    area_array = scalars_array.copy()
+                    # Store area array:
+                    if ishape == 0:
+                        area_array = scalars_array.copy()
 
     if normalize_by_area:
         use_area = area_array
@@ -310,7 +320,7 @@ def write_shape_stats(labels_or_file=[], sulci=[], fundi=[],
             xyz_positions = np.asarray(positions)
             for ixyz, xyz in enumerate(['x','y','z']):
                 column_names.append('mean position: {0}'.format(xyz))
-                columns.append(xyz_positions[:, ixyz].tolist())
+                columns.append(xyz_positions[:, ixyz])
 
             # ----------------------------------------------------------------
             # Mean positions in standard space:
@@ -326,7 +336,7 @@ def write_shape_stats(labels_or_file=[], sulci=[], fundi=[],
                 for ixyz, xyz in enumerate(['x','y','z']):
                     column_names.append('mean position in standard space:'
                                         ' {0}'.format(xyz))
-                    columns.append(xyz_std_positions[:, ixyz].tolist())
+                    columns.append(xyz_std_positions[:, ixyz])
 
             # ----------------------------------------------------------------
             # Laplace-Beltrami spectra:
@@ -346,7 +356,7 @@ def write_shape_stats(labels_or_file=[], sulci=[], fundi=[],
 
                     # Append spectral shape name and values to columns:
                     for ispec in range(spectrum_start, len_spectrum):
-                        columns.append(spectrum_matrix[:, ispec].tolist())
+                        columns.append(spectrum_matrix[:, ispec])
                         column_names.append('Laplace-Beltrami spectrum:'
                                             ' component {0}'.format(ispec+1))
 
@@ -368,7 +378,7 @@ def write_shape_stats(labels_or_file=[], sulci=[], fundi=[],
 
                     # Append Zernike shape name and values to columns:
                     for imoment in range(0, len_moments):
-                        columns.append(moments_matrix[:, imoment].tolist())
+                        columns.append(moments_matrix[:, imoment])
                         column_names.append('Zernike moments: component {0}'.
                                             format(imoment+1))
 
@@ -508,6 +518,7 @@ def write_vertex_measures(output_table, labels_or_file, sulci=[], fundi=[],
     import os
     import numpy as np
     import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
 
     from mindboggle.mio.vtks import read_scalars, read_vtk, \
         apply_affine_transforms
@@ -549,6 +560,17 @@ def write_vertex_measures(output_table, labels_or_file, sulci=[], fundi=[],
             columns.append(values)
             column_names.append(feature_names[ifeature])
 
+    # Points are read from the first shape file found; scalars of the
+    # remaining shape files are read concurrently:
+    found_files = [x for x in shape_files if os.path.exists(x)]
+    if len(found_files) > 1:
+        with ThreadPoolExecutor(max_workers=len(found_files) - 1) as executor:
+            found_scalars = dict(zip(found_files[1:],
+                                     executor.map(read_scalars,
+                                                  found_files[1:])))
+    else:
+        found_scalars = {}
+
     first_pass = True
     for ishape, shape_file in enumerate(shape_files):
         if os.path.exists(shape_file):
@@ -556,11 +578,12 @@ def write_vertex_measures(output_table, labels_or_file, sulci=[], fundi=[],
 
                 # Append x,y,z position per vertex to columns:
                 points, indices, lines, faces, scalars, scalar_names, \
-                    npoints, input_vtk = read_vtk(shape_file)
-                xyz_positions = np.asarray(points)
+                    npoints, input_vtk = read_vtk(shape_file,
+                                                  return_arrays=True)
+                xyz_positions = points
                 for ixyz, xyz in enumerate(['x','y','z']):
                     column_names.append('position: {0}'.format(xyz))
-                    columns.append(xyz_positions[:, ixyz].tolist())
+                    columns.append(xyz_positions[:, ixyz])
                 first_pass = False
 
                 # Append standard space x,y,z position to columns:
@@ -573,9 +596,9 @@ def write_vertex_measures(output_table, labels_or_file, sulci=[], fundi=[],
                     for ixyz, xyz in enumerate(['x','y','z']):
                         column_names.append('position in standard space:'
                                             ' {0}'.format(xyz))
-                        columns.append(xyz_std_positions[:, ixyz].tolist())
+                        columns.append(xyz_std_positions[:, ixyz])
             else:
-                scalars, name = read_scalars(shape_file)
+                scalars, name = found_scalars[shape_file]
             if len(scalars):
                 columns.append(scalars)
                 column_names.append(shape_names[ishape])
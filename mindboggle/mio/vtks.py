@@ -48,6 +48,7 @@ def read_vertices(filename):
 
     """
     import vtk
+    from vtk.util.numpy_support import vtk_to_numpy
 
     Reader = vtk.vtkDataSetReader()
     Reader.SetFileName(filename)
@@ -56,7 +57,7 @@ def read_vertices(filename):
     Data = Reader.GetOutput()
 
     Vrts = Data.GetVerts()
-    indices = [Vrts.GetData().GetValue(i) for i in range(1, Vrts.GetSize())]
+    indices = vtk_to_numpy(Vrts.GetData())[1:].tolist()
 
     return indices
 
@@ -94,6 +95,7 @@ def read_lines(filename):
 
     """
     import vtk
+    from vtk.util.numpy_support import vtk_to_numpy
 
     Reader = vtk.vtkDataSetReader()
     Reader.SetFileName(filename)
@@ -102,16 +104,18 @@ def read_lines(filename):
     Data = Reader.GetOutput()
     Lns = Data.GetLines()
 
-    lines  = [[Lns.GetData().GetValue(j) for j in range(i*3+1, i*3+3) ]
-              for i in range(Data.GetNumberOfLines())]
+    # Line segments are stored as rows of [2, v0, v1]:
+    if Data.GetNumberOfLines() > 0:
+        lines = vtk_to_numpy(Lns.GetData()).reshape(-1, 3)[:, 1:3].tolist()
+    else:
+        lines = []
 
-    PointData = Data.GetPointData()
-    print("There are {0} scalars in file {1}".format(
-        Reader.GetNumberOfscalarsInFile(), filename))
-    print("Loading the scalar {0}".format(Reader.GetScalarsNameInFile(0)))
-    ScalarsArray = PointData.GetArray(Reader.GetScalarsNameInFile(0))
-    scalars = [ScalarsArray.GetValue(i)
-               for i in range(0, ScalarsArray.GetDataSize())]
+    # The reader loads the first scalars by default; asking it for the
+    # number or names of scalars in the file would make it rescan the file:
+    ScalarsArray = Data.GetPointData().GetScalars()
+    print("Loading the scalar {0} from file {1}".format(
+        ScalarsArray.GetName(), filename))
+    scalars = vtk_to_numpy(ScalarsArray).ravel().tolist()
 
     return lines, scalars
 
@@ -150,6 +154,7 @@ def read_points(filename):
 
     """
     import vtk
+    from vtk.util.numpy_support import vtk_to_numpy
 
     Reader = vtk.vtkDataSetReader()
     Reader.SetFileName(filename)
@@ -157,8 +162,10 @@ def read_points(filename):
     Reader.Update()
 
     Data = Reader.GetOutput()
-    points = [list(Data.GetPoint(point_id))
-              for point_id in range(Data.GetNumberOfPoints())]
+    if Data.GetNumberOfPoints() > 0:
+        points = vtk_to_numpy(Data.GetPoints().GetData()).tolist()
+    else:
+        points = []
 
     return points
 
@@ -204,6 +211,7 @@ def read_faces_points(filename):
 
     """
     import vtk
+    from vtk.util.numpy_support import vtk_to_numpy
 
     Reader = vtk.vtkDataSetReader()
     Reader.SetFileName(filename)
@@ -211,14 +219,16 @@ def read_faces_points(filename):
     Reader.Update()
 
     Data = Reader.GetOutput()
-    points = [list(Data.GetPoint(point_id))
-              for point_id in range(Data.GetNumberOfPoints())]
+    if Data.GetNumberOfPoints() > 0:
+        points = vtk_to_numpy(Data.GetPoints().GetData()).tolist()
+    else:
+        points = []
     npoints = len(points)
 
     if Data.GetNumberOfPolys() > 0:
-        faces = [[int(Data.GetPolys().GetData().GetValue(j))
-                  for j in range(i*4 + 1, i*4 + 4)]
-                  for i in range(Data.GetPolys().GetNumberOfCells())]
+        # Triangles are stored as rows of [3, v0, v1, v2]:
+        faces = vtk_to_numpy(Data.GetPolys().GetData()).reshape(-1, 4)[:, 1:4]
+        faces = faces.tolist()
     else:
         faces = []
 
@@ -255,22 +265,47 @@ def read_scalars(filename, return_first=True, return_array=False):
     >>> depths, name = read_scalars(depth_file)
     >>> name
     'scalars'
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in depths[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in depths[0:5]]
     [0.02026, 0.06009, 0.12859, 0.04564, 0.00774]
 
     """
     #import os
     import vtk
+    from vtk.util.numpy_support import vtk_to_numpy
     if return_first and return_array:
         import numpy as np
 
     Reader = vtk.vtkDataSetReader()
     Reader.SetFileName(filename)
-    Reader.ReadAllScalarsOn()  # Activate the reading of all scalars
+    if not return_first:
+        Reader.ReadAllScalarsOn()  # Activate the reading of all scalars
     Reader.Update()
     Data = Reader.GetOutput()
     PointData = Data.GetPointData()
 
+    # Only the first (active) scalars are needed, so skip parsing the others
+    # and a second pass over the file to list their names:
+    if return_first:
+        scalar_array = PointData.GetScalars()
+        if scalar_array:
+            scalar_names = scalar_array.GetName()
+            if return_array:
+                # Same dtypes as converting the list (float64 or int64):
+                scalars = vtk_to_numpy(scalar_array).ravel()
+                if scalars.dtype.kind == 'f':
+                    scalars = scalars.astype(float)
+                else:
+                    scalars = scalars.astype(int)
+            else:
+                scalars = vtk_to_numpy(scalar_array).ravel().tolist()
+        else:
+            scalar_names = ''
+            if return_array:
+                scalars = np.array([])
+            else:
+                scalars = []
+        return scalars, scalar_names
+
     scalars = []
     scalar_names = []
     if Reader.GetNumberOfScalarsInFile() > 0:
@@ -287,8 +322,7 @@ def read_scalars(filename, return_first=True, return_array=False):
             #                 os.path.basename(filename)))
 
             scalar_array = PointData.GetArray(scalar_name)
-            scalar = [scalar_array.GetValue(i)
-                      for i in range(scalar_array.GetDataSize())]
+            scalar = vtk_to_numpy(scalar_array).ravel().tolist()
             scalars.append(scalar)
             scalar_names.append(scalar_name)
 
@@ -305,7 +339,8 @@ def read_scalars(filename, return_first=True, return_array=False):
     return scalars, scalar_names
 
 
-def read_vtk(input_vtk, return_first=True, return_array=False):
+def read_vtk(input_vtk, return_first=True, return_array=False,
+             return_arrays=False):
     """
     Load faces, lines, indices, points, #points,
     and all scalar lookup tables from a VTK file.
@@ -325,6 +360,9 @@ def read_vtk(input_vtk, return_first=True, return_array=False):
         Return only the first list of scalar values?
     return_array : bool (only if return_first)
         Return first list of scalars as a numpy array?
+    return_arrays : bool
+        Return points, indices, lines, and faces as numpy arrays
+        (points as float32 N x 3, faces as F x 3) rather than lists?
 
     Returns
     -------
@@ -364,7 +402,7 @@ def read_vtk(input_vtk, return_first=True, return_array=False):
      [-14.9617  -76.2497   -2.62924]
      [-12.4807  -76.1401   -3.98634]
      [-13.3426  -76.1914   -3.3657 ]]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in scalars[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in scalars[0:5]]
     [0.02026, 0.06009, 0.12859, 0.04564, 0.00774]
     >>> faces[0:5]
     [[0, 1, 4], [5, 4, 1], [0, 48, 49], [0, 49, 1], [0, 4, 48]]
@@ -372,44 +410,70 @@ def read_vtk(input_vtk, return_first=True, return_array=False):
     """
     #import os
     import vtk
-    if return_first and return_array:
-        import numpy as np
+    import numpy as np
+    from vtk.util.numpy_support import vtk_to_numpy
 
     Reader = vtk.vtkDataSetReader()
     Reader.SetFileName(input_vtk)
-    Reader.ReadAllScalarsOn()  # Activate the reading of all scalars
+    if not return_first:
+        Reader.ReadAllScalarsOn()  # Activate the reading of all scalars
     Reader.Update()
 
     Data = Reader.GetOutput()
     PointData = Data.GetPointData()
-    points = [list(Data.GetPoint(point_id))
-              for point_id in range(0, Data.GetNumberOfPoints())]
+    if Data.GetNumberOfPoints() > 0:
+        points = vtk_to_numpy(Data.GetPoints().GetData())
+    else:
+        points = np.zeros((0, 3), dtype=np.float32)
     npoints = len(points)
 
     if Data.GetNumberOfPolys() > 0:
-        faces = [[int(Data.GetPolys().GetData().GetValue(j))
-                  for j in range(i*4 + 1, i*4 + 4)]
-                  for i in range(Data.GetPolys().GetNumberOfCells())]
+        # Triangles are stored as rows of [3, v0, v1, v2]:
+        faces = vtk_to_numpy(Data.GetPolys().GetData()).reshape(-1, 4)[:, 1:4]
+        faces = np.ascontiguousarray(faces)
     else:
-        faces = []
+        faces = np.zeros((0, 3), dtype=int)
+
+    if not return_arrays:
+        points = points.tolist()
+        faces = faces.tolist()
 
     if Data.GetNumberOfLines() > 0:
-        lines  = [[Data.GetLines().GetData().GetValue(j)
-                   for j in range(i*3+1, i*3+3) ]
-                   for i in range(Data.GetNumberOfLines())]
+        # Line segments are stored as rows of [2, v0, v1]:
+        lines = vtk_to_numpy(Data.GetLines().GetData()).reshape(-1, 3)[:, 1:3]
+        lines = lines.tolist()
     else:
         lines = []
 
     if Data.GetNumberOfVerts() > 0:
-       indices = [Data.GetVerts().GetData().GetValue(i)
-                  for i in range(1, Data.GetVerts().GetSize() )]
+        indices = vtk_to_numpy(Data.GetVerts().GetData())[1:].tolist()
     else:
-       indices = []
+        indices = []
 
     scalars = []
     scalar_names = []
 
-    if Reader.GetNumberOfScalarsInFile() > 0:
+    # Only the first (active) scalars are needed, so read the file once
+    # (listing the names of all scalars would scan the file a second time):
+    if return_first:
+        scalar_array = PointData.GetScalars()
+        if scalar_array:
+            scalars = vtk_to_numpy(scalar_array).ravel()
+            scalar_names = scalar_array.GetName()
+            if return_array:
+                # Same dtypes as converting the list (float64 or int64):
+                if scalars.dtype.kind == 'f':
+                    scalars = scalars.astype(float)
+                else:
+                    scalars = scalars.astype(int)
+            else:
+                scalars = scalars.tolist()
+        else:
+            scalar_names = ''
+            if return_array:
+                scalars = np.array([])
+
+    elif Reader.GetNumberOfScalarsInFile() > 0:
         for scalar_index in range(Reader.GetNumberOfScalarsInFile()):
             scalar_name = Reader.GetScalarsNameInFile(scalar_index)
 
@@ -424,20 +488,13 @@ def read_vtk(input_vtk, return_first=True, return_array=False):
 
             scalar_array = PointData.GetArray(scalar_name)
             if scalar_array:
-                scalar = [scalar_array.GetValue(i)
-                          for i in range(scalar_array.GetDataSize())]
+                scalar = vtk_to_numpy(scalar_array).ravel().tolist()
                 scalars.append(scalar)
                 scalar_names.append(scalar_name)
 
-    if return_first:
-        if scalars:
-            scalars = scalars[0]
-        if return_array:
-            scalars = np.array(scalars)
-        if scalar_names:
-            scalar_names = scalar_names[0]
-        else:
-            scalar_names = ''
+    if return_arrays:
+        indices = np.asarray(indices, dtype=int)
+        lines = np.asarray(lines, dtype=int).reshape(-1, 2)
 
     return points, indices, lines, faces, scalars, scalar_names, \
            npoints, input_vtk
@@ -466,13 +523,19 @@ def write_header(Fp, Header='# vtk DataFile Version 2.0',
           - RECTILINEAR_GRID
           - FIELD
 
+    A 'BINARY' fileType expects Fp to be opened in binary mode.
+
     """
 
-    Fp.write('{0}\n{1}\n{2}\nDATASET {3}\n'.format(Header, Title, fileType,
-                                                   dataType))
+    header = '{0}\n{1}\n{2}\nDATASET {3}\n'.format(Header, Title, fileType,
+                                                   dataType)
+    if fileType == 'BINARY':
+        Fp.write(header.encode())
+    else:
+        Fp.write(header)
 
 
-def write_points(Fp, points, dataType="float"):
+def write_points(Fp, points, dataType="float", binary=False):
     """
     Write coordinates of points, the POINTS section in DATASET POLYDATA::
 
@@ -487,24 +550,38 @@ def write_points(Fp, points, dataType="float"):
         ...
         p(n-1)x p(n-1)y p(n-1)z
 
+    If binary, the coordinates are written as big-endian values
+    (Fp must be opened in binary mode).
+
     """
     import numpy as np
 
-    Fp.write('POINTS {0} {1}\n'.format(len(points), dataType))
+    points = np.asarray(points)
+
+    header = 'POINTS {0} {1}\n'.format(len(points), dataType)
 
     n = np.shape(points)[1]
-    for point in points:
-        if n == 3:
-            [R, A, S] = point
-            Fp.write('{0} {1} {2}\n'.format(R, A, S))
-        elif n == 2:
-            [R, A] = point
-            Fp.write('{0} {1}\n'.format(R, A))
+    if n not in (2, 3):
+        raise IOError('Unrecognized number of coordinates per point')
+
+    if binary:
+        if dataType == 'double':
+            big_endian = '>f8'
         else:
-            raise IOError('Unrecognized number of coordinates per point')
+            big_endian = '>f4'
+        Fp.write(header.encode())
+        Fp.write(np.ascontiguousarray(points, dtype=big_endian).tobytes())
+        Fp.write(b'\n')
+    else:
+        Fp.write(header)
+
+        # Format all rows with a single C-level %-operation
+        # (9 significant digits round-trip float32):
+        row = ' '.join(['%.9g'] * n) + '\n'
+        Fp.write((row * len(points)) % tuple(points.ravel().tolist()))
 
 
-def write_faces(Fp, faces):
+def write_faces(Fp, faces, binary=False):
     """
     Write indices to vertices forming triangular meshes or lines,
     the POLYGONS section in DATASET POLYDATA section:
@@ -513,31 +590,41 @@ def write_faces(Fp, faces):
         3 0 1 4
         ...
 
+    If binary, the indices are written as big-endian 32-bit integers
+    (Fp must be opened in binary mode).
+
     """
     import numpy as np
 
+    faces = np.asarray(faces, dtype=np.int64)
+
     n = np.shape(faces)[1]
     if n == 3:
         face_name = 'POLYGONS '
-        Fp.write('{0} {1} {2}\n'.format(face_name, len(faces),
-                 len(faces) * (n + 1)))
+        header = '{0} {1} {2}\n'.format(face_name, len(faces),
+                                        len(faces) * (n + 1))
     elif n == 2:
         face_name = 'LINES '
-        Fp.write('{0} {1} {2}\n'.format(face_name, len(faces),
-                 len(faces) * (n + 1)))
+        header = '{0} {1} {2}\n'.format(face_name, len(faces),
+                                        len(faces) * (n + 1))
     else:
         raise IOError('Unrecognized number of vertices per face')
 
-    for face in faces:
-        if n == 3:
-            [V0, V1, V2] = face
-            Fp.write('{0} {1} {2} {3}\n'.format(n, V0, V1, V2))
-        elif n == 2:
-            [V0, V1] = face
-            Fp.write('{0} {1} {2}\n'.format(n, V0, V1))
+    # Prepend the vertex count to every row and format them in one pass:
+    cells = np.empty((len(faces), n + 1), dtype=np.int64)
+    cells[:, 0] = n
+    cells[:, 1:] = faces
+    if binary:
+        Fp.write(header.encode())
+        Fp.write(cells.astype('>i4').tobytes())
+        Fp.write(b'\n')
+    else:
+        Fp.write(header)
+        row = ' '.join(['%d'] * (n + 1)) + '\n'
+        Fp.write((row * len(cells)) % tuple(cells.ravel().tolist()))
 
 
-def write_lines(Fp, lines):
+def write_lines(Fp, lines, binary=False):
     """
     Save connected line segments to a VTK file.
 
@@ -548,12 +635,14 @@ def write_lines(Fp, lines):
     lines : list of 2-tuples of integers
         each element is an edge on the mesh, consisting of 2 integers
         representing the 2 vertices of the edge
+    binary : bool
+        write big-endian binary values (Fp opened in binary mode)?
     """
 
-    write_faces(Fp, lines)
+    write_faces(Fp, lines, binary)
 
 
-def write_vertices(Fp, indices):
+def write_vertices(Fp, indices, binary=False):
     """
     Write indices to vertices, the VERTICES section
     in the DATASET POLYDATA section::
@@ -572,17 +661,30 @@ def write_vertices(Fp, indices):
     Note::
 
         Currently we write all vertices in one line.
+        If binary, the line is written as big-endian 32-bit integers
+        (Fp must be opened in binary mode).
 
     """
 
-    Fp.write('VERTICES {0} {1}\n{2} '.format(
-             1, len(indices) + 1, len(indices)))
-    [Fp.write('{0} '.format(i)) for i in indices]
-    Fp.write('\n')
+    import numpy as np
+
+    # One cell holding every index, preceded by its size:
+    cell = np.empty(len(indices) + 1, dtype=np.int64)
+    cell[0] = len(indices)
+    cell[1:] = indices
+
+    if binary:
+        Fp.write('VERTICES {0} {1}\n'.format(1, len(cell)).encode())
+        Fp.write(cell.astype('>i4').tobytes())
+        Fp.write(b'\n')
+    else:
+        Fp.write('VERTICES {0} {1}\n'.format(1, len(cell)))
+        Fp.write(('%d ' * len(cell)) % tuple(cell.tolist()))
+        Fp.write('\n')
 
 
 def write_scalars(Fp, scalars, scalar_name, begin_scalars=True,
-                  scalar_type='float'):
+                  scalar_type='float', binary=False):
     """
     Write per-VERTEX values as a scalar lookup table into a VTK file::
 
@@ -609,20 +711,49 @@ def write_scalars(Fp, scalars, scalar_name, begin_scalars=True,
         True if the first vertex lookup table in a VTK file
     scalar_type : string
         type of scalars ('float' or 'int')
+    binary : bool
+        write big-endian binary values (Fp opened in binary mode)?
 
     """
 
+    import numpy as np
+
+    header = ''
     if begin_scalars:
-        Fp.write('POINT_DATA {0}\n'.format(len(scalars)))
-    Fp.write('SCALARS {0} {1}\n'.format(scalar_name, scalar_type))
-    Fp.write('LOOKUP_TABLE {0}\n'.format(scalar_name))
-    for Value in scalars:
-        Fp.write('{0}\n'.format(Value))
-    Fp.write('\n')
+        header += 'POINT_DATA {0}\n'.format(len(scalars))
+    header += 'SCALARS {0} {1}\n'.format(scalar_name, scalar_type)
+    header += 'LOOKUP_TABLE {0}\n'.format(scalar_name)
+
+    if binary:
+        big_endian = {'int': '>i4', 'float': '>f4', 'double': '>f8'}
+        if scalar_type not in big_endian:
+            raise IOError('Unsupported binary scalar type: ' + scalar_type)
+        Fp.write(header.encode())
+        Fp.write(np.asarray(scalars,
+                            dtype=big_endian[scalar_type]).tobytes())
+        Fp.write(b'\n')
+    else:
+        Fp.write(header)
+
+        # Format numeric values with a single C-level %-operation
+        # (9 significant digits round-trip float32, 17 round-trip double):
+        values = np.asarray(scalars)
+        if values.ndim == 1 and values.dtype.kind in 'iu':
+            Fp.write(('%d\n' * len(values)) % tuple(values.tolist()))
+        elif values.ndim == 1 and values.dtype.kind == 'f':
+            if scalar_type == 'double':
+                row = '%.17g\n'
+            else:
+                row = '%.9g\n'
+            Fp.write((row * len(values)) % tuple(values.tolist()))
+        else:
+            Fp.write(''.join(['{0}\n'.format(Value) for Value in scalars]))
+        Fp.write('\n')
 
 
 def write_vtk(output_vtk, points, indices=[], lines=[], faces=[],
-              scalars=[], scalar_names=['scalars'], scalar_type='float'):
+              scalars=[], scalar_names=['scalars'], scalar_type='float',
+              binary=False):
     """
     Save lists of scalars into the lookup table of a VTK-format file.
 
@@ -637,14 +768,14 @@ def write_vtk(output_vtk, points, indices=[], lines=[], faces=[],
     ----------
     output_vtk : string
         path of the output VTK file
-    points :  list of 3-tuples of floats
+    points :  list of 3-tuples of floats (or numpy array)
         each element has 3 numbers representing the coordinates of the points
-    indices : list of integers
+    indices : list of integers (or numpy array)
         indices of vertices
     lines : list of 2-tuples of integers
         Each element is an edge on the mesh, consisting of 2 integers
         representing the 2 vertices of the edge
-    faces : list of 3-tuples of integers
+    faces : list of 3-tuples of integers (or numpy array)
         indices to the three vertices of a face on the mesh
     scalars : list of floats, or list of lists of floats;
         each list (lookup table) contains values assigned to the vertices
@@ -652,6 +783,8 @@ def write_vtk(output_vtk, points, indices=[], lines=[], faces=[],
         each element is the name of a scalar list (lookup table)
     scalar_type : string
         type of scalars ('float' or 'int')
+    binary : bool
+        write a BINARY (big-endian) rather than an ASCII VTK file?
 
     Examples
     --------
@@ -694,30 +827,31 @@ def write_vtk(output_vtk, points, indices=[], lines=[], faces=[],
     """
     import os
     import numpy as np
-    from io import open
+    from io import open, StringIO, BytesIO
 
     from mindboggle.mio.vtks import write_header, write_points, \
         write_vertices, write_faces, write_scalars, scalars_checker
 
-    # Convert numpy arrays to lists
-    if isinstance(faces, np.ndarray):
-        faces = faces.tolist()
-    if isinstance(points, np.ndarray):
-        points = points.tolist()
-
     output_vtk = os.path.join(os.getcwd(), output_vtk)
 
-    Fp = open(output_vtk,'w', encoding="utf-8")
-    write_header(Fp)
-    write_points(Fp, points)
-    if indices:
-        write_vertices(Fp, indices)
-    if lines:
-        for i in range(0,len(lines)):
-            lines[i] = [lines[i][0], lines[i][1]]
-        write_faces(Fp, lines) # write_faces can write either lines or faces
-    if faces:
-        write_faces(Fp, faces)
+    # Assemble the file in memory and write it out with a single call:
+    if binary:
+        Fp = BytesIO()
+        write_header(Fp, fileType='BINARY')
+    else:
+        Fp = StringIO()
+        write_header(Fp)
+    # Numpy arrays (e.g. from read_vtk(..., return_arrays=True)) are
+    # passed straight to the writers, without a round trip through lists:
+    write_points(Fp, points, binary=binary)
+    if len(indices):
+        write_vertices(Fp, indices, binary)
+    if len(lines):
+        # Keep the two end points of each line (without modifying the input):
+        lines = np.asarray(lines)[:, 0:2]
+        write_faces(Fp, lines, binary) # write_faces can write lines or faces
+    if len(faces):
+        write_faces(Fp, faces, binary)
     scalars, scalar_names = scalars_checker(scalars, scalar_names)
     if len(scalars):
 
@@ -725,14 +859,22 @@ def write_vtk(output_vtk, points, indices=[], lines=[], faces=[],
             if i == 0:
                 scalar_name = scalar_names[i]
                 write_scalars(Fp, scalar_list, scalar_name,
-                              begin_scalars=True, scalar_type=scalar_type)
+                              begin_scalars=True, scalar_type=scalar_type,
+                              binary=binary)
             else:
                 if len(scalar_names) < i + 1:
                     scalar_name = scalar_names[0]
                 else:
                     scalar_name = scalar_names[i]
                 write_scalars(Fp, scalar_list, scalar_name,
-                              begin_scalars=False, scalar_type=scalar_type)
+                              begin_scalars=False, scalar_type=scalar_type,
+                              binary=binary)
+    if binary:
+        with open(output_vtk, 'wb') as fid:
+            fid.write(Fp.getvalue())
+    else:
+        with open(output_vtk, 'w', encoding="utf-8") as fid:
+            fid.write(Fp.getvalue())
     Fp.close()
 
     if not os.path.exists(output_vtk):
@@ -741,7 +883,7 @@ def write_vtk(output_vtk, points, indices=[], lines=[], faces=[],
 
 def rewrite_scalars(input_vtk, output_vtk, new_scalars,
                     new_scalar_names=['scalars'], filter_scalars=[],
-                    background_value=-1):
+                    background_value=-1, binary=False):
     """
     Load VTK format file and save a subset of scalars into a new file.
 
@@ -759,6 +901,8 @@ def rewrite_scalars(input_vtk, output_vtk, new_scalars,
         scalar values used to filter faces (foreground values retained)
     background_value : integer
         background value
+    binary : bool
+        write a BINARY (big-endian) rather than an ASCII VTK file?
 
     Examples
     --------
@@ -787,17 +931,16 @@ def rewrite_scalars(input_vtk, output_vtk, new_scalars,
     """
     import os
     import numpy as np
-    from io import open
+    from io import open, StringIO, BytesIO
 
     from mindboggle.guts.mesh import keep_faces, reindex_faces_points
     from mindboggle.mio.vtks import write_header, write_points, \
         write_vertices, write_faces, write_scalars, read_vtk, scalars_checker
 
-    # Convert numpy arrays to lists
+    # Convert numpy arrays to lists (filter_scalars is only used as an array)
     if isinstance(new_scalars, np.ndarray):
         new_scalars = new_scalars.tolist()
-    if isinstance(filter_scalars, np.ndarray):
-        filter_scalars = filter_scalars.tolist()
+    filter_scalars = np.asarray(filter_scalars)
 
     # Output VTK file to current working directory
     output_vtk = os.path.join(os.getcwd(), output_vtk)
@@ -807,31 +950,34 @@ def rewrite_scalars(input_vtk, output_vtk, new_scalars,
         input_vtk = read_vtk(input_vtk)
 
     # Find indices to foreground values
-    if filter_scalars:
-        indices_keep = [i for i,x in enumerate(filter_scalars)
-                        if x != background_value]
+    if filter_scalars.size:
+        indices_keep = np.flatnonzero(filter_scalars != background_value)
         #indices_remove = [i for i,x in enumerate(filter_scalars)
         #                  if x == background_value]
         # Remove surface faces whose three vertices are not all in indices
         faces = keep_faces(faces, indices_keep)
         faces, points, original_indices = reindex_faces_points(faces, points)
 
-    # Write VTK file
-    Fp = open(output_vtk,'w', encoding="utf-8")
-    write_header(Fp)
+    # Write VTK file (assembled in memory and written with a single call)
+    if binary:
+        Fp = BytesIO()
+        write_header(Fp, fileType='BINARY')
+    else:
+        Fp = StringIO()
+        write_header(Fp)
     if points:
-        write_points(Fp, points)
+        write_points(Fp, points, binary=binary)
     if indices:
-        write_vertices(Fp, indices)
+        write_vertices(Fp, indices, binary)
     if faces:
-        write_faces(Fp, faces)
+        write_faces(Fp, faces, binary)
     if new_scalars:
         new_scalars, new_scalar_names = scalars_checker(new_scalars,
                                                         new_scalar_names)
 
         # scalars_checker() returns a list of lists for scalars:
         for i, new_scalar_list in enumerate(new_scalars):
-            if filter_scalars:
+            if filter_scalars.size:
                 new_scalar_list = np.array(new_scalar_list)[original_indices].\
                     tolist()
             #    for iremove in indices_remove:
@@ -846,7 +992,7 @@ def rewrite_scalars(input_vtk, output_vtk, new_scalars,
                 new_scalar_name = new_scalar_names[0]
                 write_scalars(Fp, new_scalar_list, new_scalar_name,
                               begin_scalars=True,
-                              scalar_type=scalar_type)
+                              scalar_type=scalar_type, binary=binary)
             else:
                 if len(new_scalar_names) < i + 1:
                     new_scalar_name = new_scalar_names[0]
@@ -854,10 +1000,16 @@ def rewrite_scalars(input_vtk, output_vtk, new_scalars,
                     new_scalar_name = new_scalar_names[i]
                 write_scalars(Fp, new_scalar_list, new_scalar_name,
                               begin_scalars=False,
-                              scalar_type=scalar_type)
+                              scalar_type=scalar_type, binary=binary)
     else:
         raise IOError('new_scalars is empty')
 
+    if binary:
+        with open(output_vtk, 'wb') as fid:
+            fid.write(Fp.getvalue())
+    else:
+        with open(output_vtk, 'w', encoding="utf-8") as fid:
+            fid.write(Fp.getvalue())
     Fp.close()
 
     if not os.path.exists(output_vtk):
@@ -877,9 +1029,11 @@ def explode_scalars(input_indices_vtk, input_values_vtk='', output_stem='',
 
     Parameters
     ----------
-    input_indices_vtk : string
+    input_indices_vtk : string or tuple
         path of the input VTK file that contains indices as scalars
-        (assumes that the scalars are a list of floats or integers)
+        (assumes that the scalars are a list of floats or integers),
+        or the output of read_vtk(input_indices_vtk, True, True)
+        to avoid reading the same file again
     input_values_vtk : string
         path of the input VTK file that contains values as scalars
     output_stem : string
@@ -948,14 +1102,18 @@ def explode_scalars(input_indices_vtk, input_values_vtk='', output_stem='',
     import os
     import numpy as np
     from mindboggle.mio.vtks import read_scalars, read_vtk, write_vtk
-    from mindboggle.guts.mesh import reindex_faces_points, keep_faces
+    from mindboggle.guts.mesh import reindex_faces_points
+
+    # Load VTK file (unless already loaded):
+    if isinstance(input_indices_vtk, str):
+        input_vtk = read_vtk(input_indices_vtk, True, True)
+    else:
+        input_vtk = input_indices_vtk
+    points, indices, lines, faces, scalars, scalar_names, npoints, \
+        input_indices_vtk = input_vtk
 
     if not input_values_vtk:
         input_values_vtk = input_indices_vtk
-
-    # Load VTK file:
-    points, indices, lines, faces, scalars, scalar_names, npoints, \
-        input_vtk = read_vtk(input_indices_vtk, True, True)
     if verbose:
         print("Explode the scalar list in {0}".
             format(os.path.basename(input_indices_vtk)))
@@ -978,13 +1136,31 @@ def explode_scalars(input_indices_vtk, input_values_vtk='', output_stem='',
         unique_scalars = [x for x in unique_scalars
                           if x not in exclude_values]
 
+    # Bucket faces by scalar value once: a face belongs to a scalar value
+    # if its three (distinct) vertices all have that value, which is what
+    # keep_faces() would retain for that value's vertices. The stable sort
+    # keeps each bucket in the original face order, so each scalar value
+    # only costs a slice instead of a pass over all vertices and faces:
+    if remove_background_faces:
+        faces = np.reshape(np.asarray(faces, dtype=int), (-1, 3))
+        face_scalars = scalars[faces]
+        same = (face_scalars[:, 0] == face_scalars[:, 1]) & \
+               (face_scalars[:, 1] == face_scalars[:, 2]) & \
+               (faces[:, 0] != faces[:, 1]) & \
+               (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+        face_order = np.flatnonzero(same)
+        face_order = face_order[np.argsort(face_scalars[face_order, 0],
+                                           kind='stable')]
+        sorted_face_scalars = face_scalars[face_order, 0]
+
     output_files =[]
     for scalar in unique_scalars:
 
         # Remove background (keep only faces with the scalar):
         if remove_background_faces:
-            scalar_indices = [i for i,x in enumerate(scalars) if x == scalar]
-            scalar_faces = keep_faces(faces, scalar_indices)
+            scalar_faces = faces[face_order[
+                np.searchsorted(sorted_face_scalars, scalar, 'left'):
+                np.searchsorted(sorted_face_scalars, scalar, 'right')]].tolist()
         else:
             scalar_faces = faces
 
@@ -1064,7 +1240,7 @@ def explode_scalars_mindboggle(subject_path, output_path='',
 
     """
     import os
-    from mindboggle.mio.vtks import explode_scalars
+    from mindboggle.mio.vtks import explode_scalars, read_vtk
 
     if not os.path.exists(output_path):
         raise IOError("{0} does not exist".format(output_path))
@@ -1094,6 +1270,8 @@ def explode_scalars_mindboggle(subject_path, output_path='',
                                   #'fundus_per_sulcus', 'folds'}")
 
                 labels_vtk = os.path.join(subject_path, File)
+                # Read the labels (and mesh) once for all shapes:
+                labels = read_vtk(labels_vtk, True, True)
                 shapes_path = os.path.join(subject_path, 'shapes',
                                            side + '_cortical_surface')
                 shape_names = ['travel_depth',
@@ -1111,7 +1289,7 @@ def explode_scalars_mindboggle(subject_path, output_path='',
                         print("Explode {0} by {1} values from {2}").\
                             format(shape_vtk, pieces, labels_vtk)
 
-                    output_files = explode_scalars(labels_vtk, shape_vtk,
+                    output_files = explode_scalars(labels, shape_vtk,
                                     os.path.join(output_dir,
                                                  shape_name + '_'),
                                     [background_value], background_value,
@@ -1274,7 +1452,7 @@ def scalars_checker(scalars, scalar_names):
 #
 #     affine = affine_lines[3]
 #     affine = affine.split()
-#     affine = [np.float(x) for x in affine[1::]]
+#     affine = [float(x) for x in affine[1::]]
 #     affine = np.reshape(affine, (4,3))
 #     linear_transform = affine[0:3,:]
 #     translation = affine[3,:]
@@ -1283,7 +1461,7 @@ def scalars_checker(scalars, scalar_names):
 #
 #     fixed_parameters = affine_lines[4]
 #     fixed_parameters = fixed_parameters.split()
-#     fixed_parameters = [np.float(x) for x in fixed_parameters[1::]]
+#     fixed_parameters = [float(x) for x in fixed_parameters[1::]]
 #
 #     return transform, fixed_parameters
 #
@@ -1503,7 +1681,8 @@ def apply_affine_transforms(transform_files, inverse_booleans,
     return affine_points, output_file
 
 
-def freesurfer_surface_to_vtk(surface_file, orig_file='', output_vtk=''):
+def freesurfer_surface_to_vtk(surface_file, orig_file='', output_vtk='',
+                              binary=False):
     """
     Convert FreeSurfer surface file to VTK format.
 
@@ -1521,6 +1700,8 @@ def freesurfer_surface_to_vtk(surface_file, orig_file='', output_vtk=''):
         name of output VTK file; if blank, appends
         ".vtk" to surface_file and saves to the
         current working directory.
+    binary : bool
+        write a (legacy) BINARY VTK file of big-endian values?
 
     Returns
     -------
@@ -1551,13 +1732,18 @@ def freesurfer_surface_to_vtk(surface_file, orig_file='', output_vtk=''):
 
     """
     import os
+    import mmap
+    import numpy as np
     import nibabel as nb
-    from io import open
+    from io import open, StringIO
 
     from mindboggle.mio.vtks import write_header, write_points, write_faces
 
     surf = nb.freesurfer.read_geometry(surface_file)
-    points = surf[0]
+    # The surface file stores single-precision coordinates, which nibabel
+    # returns as double; keep them (and the transform below) in single
+    # precision, as they are written out as 32-bit floats:
+    points = surf[0].astype(np.float32)
     faces = surf[1]
 
     # Transform surface coordinates into normal scanner RAS.
@@ -1569,28 +1755,83 @@ def freesurfer_surface_to_vtk(surface_file, orig_file='', output_vtk=''):
                                  "..", "mri", "orig.mgz")
 
     if os.path.exists(orig_file):
-        import numpy as np
-        Norig = nb.load(orig_file).get_affine()
-        Torig = np.array([[-1, 0, 0, 128],
-                          [0, 0, 1, -128],
-                          [0, -1, 0, 128],
-                          [0, 0, 0, 1]], dtype=float)
-        xfm = np.dot(Norig, np.linalg.inv(Torig))
-        points = np.transpose(np.dot(xfm, np.transpose(
-            np.concatenate((points, np.ones((np.shape(points)[0],1))),
-                           axis=1))))[:,0:3]
+        # Only the header's vox2ras matrix is needed (image data are
+        # not loaded).  The inverse of the constant conformed-space tkr
+        # vox2ras matrix, Torig = [[-1, 0, 0, 128], [0, 0, 1, -128],
+        # [0, -1, 0, 128], [0, 0, 0, 1]], is written out directly:
+        Norig = nb.load(orig_file).affine
+        Torig_inverse = np.array([[-1, 0, 0, 128],
+                                  [0, 0, -1, 128],
+                                  [0, 1, 0, 128],
+                                  [0, 0, 0, 1]], dtype=float)
+        xfm = np.dot(Norig, Torig_inverse)
+        # The rotation and translation parts of the affine are applied
+        # to the (N,3) points directly, without homogeneous coordinates
+        # (keeping the single-precision points read from the surface file),
+        # when the points are written to the output file below:
+        xfm = xfm.astype(np.float32)
+        rotation = xfm[0:3, 0:3].T
+        translation = xfm[0:3, 3]
     else:
         raise IOError(orig_file + " does not exist in the FreeSurfer "
                       "subjects directory.")
 
     if not output_vtk:
         output_vtk = os.path.join(os.getcwd(),
-                                  os.path.basename(surface_file + '.vtk'))
-    Fp = open(output_vtk, 'w')
-    write_header(Fp, Title='vtk output from ' + surface_file)
-    write_points(Fp, points)
-    write_faces(Fp, faces)
-    Fp.close()
+                                  os.path.basename(surface_file) + '.vtk')
+
+    # Write a (legacy) BINARY VTK file.  The file's final size is known in
+    # advance, so memory-map it and write the transformed points
+    # (big-endian float) and the faces (big-endian int, each preceded by
+    # its vertex count) directly into the mapping:
+    if binary:
+        points_header = '# vtk DataFile Version 2.0\n{0}\nBINARY\n' \
+                        'DATASET POLYDATA\nPOINTS {1} float\n'.format(
+                        'vtk output from ' + surface_file,
+                        len(points)).encode('utf-8')
+        faces_header = '\nPOLYGONS {0} {1}\n'.format(
+                       len(faces), 4 * len(faces)).encode('utf-8')
+        points_start = len(points_header)
+        faces_start = points_start + 4 * points.size + len(faces_header)
+        nbytes = faces_start + 16 * len(faces) + 1
+
+        with open(output_vtk, 'w+b') as Fp:
+            Fp.truncate(nbytes)
+            mapped = mmap.mmap(Fp.fileno(), nbytes)
+            try:
+                mapped[0:points_start] = points_header
+                mapped_points = np.frombuffer(mapped, dtype='>f4',
+                                              count=points.size,
+                                              offset=points_start
+                                              ).reshape(-1, 3)
+                np.matmul(points, rotation, out=mapped_points)
+                mapped_points += translation
+                mapped[faces_start - len(faces_header):faces_start] = \
+                    faces_header
+                mapped_faces = np.frombuffer(mapped, dtype='>i4',
+                                             count=4 * len(faces),
+                                             offset=faces_start
+                                             ).reshape(-1, 4)
+                mapped_faces[:, 0] = 3
+                mapped_faces[:, 1:] = faces
+                mapped[nbytes - 1:nbytes] = b'\n'
+                del mapped_points, mapped_faces
+                mapped.flush()
+            finally:
+                mapped.close()
+
+    # Otherwise assemble an ASCII file in memory and write it out with a
+    # single call:
+    else:
+        points = np.dot(points, rotation)
+        points += translation
+        Fp = StringIO()
+        write_header(Fp, Title='vtk output from ' + surface_file)
+        write_points(Fp, points)
+        write_faces(Fp, faces)
+        with open(output_vtk, 'w', encoding="utf-8") as fid:
+            fid.write(Fp.getvalue())
+        Fp.close()
 
     if not os.path.exists(output_vtk):
         raise IOError("Output VTK file " + output_vtk + " not created.")
@@ -1599,7 +1840,7 @@ def freesurfer_surface_to_vtk(surface_file, orig_file='', output_vtk=''):
 
 
 def freesurfer_curvature_to_vtk(surface_file, vtk_file, output_vtk='',
-                                background_value=-1):
+                                background_value=-1, binary=False):
     """
     Convert FreeSurfer curvature, thickness, or convexity file to VTK format.
 
@@ -1613,6 +1854,8 @@ def freesurfer_curvature_to_vtk(surface_file, vtk_file, output_vtk='',
         name of output VTK file
     background_value : integer or float
         background value
+    binary : bool
+        write a BINARY (big-endian) rather than an ASCII VTK file?
 
     Returns
     -------
@@ -1639,18 +1882,21 @@ def freesurfer_curvature_to_vtk(surface_file, vtk_file, output_vtk='',
 
     """
     import os
+    import numpy as np
     import nibabel as nb
 
     from mindboggle.mio.vtks import rewrite_scalars
 
-    curvature_values = nb.freesurfer.read_morph_data(surface_file)
+    # Morphometry values are stored as (big-endian) float32:
+    curvature_values = np.asarray(nb.freesurfer.read_morph_data(surface_file),
+                                  dtype=np.float32)
     scalar_names = os.path.basename(surface_file)
 
     if not output_vtk:
         output_vtk = os.path.join(os.getcwd(),
                                   os.path.basename(surface_file)+'.vtk')
     rewrite_scalars(vtk_file, output_vtk, curvature_values, scalar_names,
-                    [], background_value)
+                    [], background_value, binary)
     if not os.path.exists(output_vtk):
         raise IOError("Output VTK file " + output_vtk + " not created.")
 
@@ -1658,7 +1904,7 @@ def freesurfer_curvature_to_vtk(surface_file, vtk_file, output_vtk='',
 
 
 def freesurfer_annot_to_vtk(annot_file, vtk_file, output_vtk='',
-                            background_value=-1):
+                            background_value=-1, binary=False):
     """
     Load a FreeSurfer .annot file and save as a VTK format file.
 
@@ -1673,6 +1919,8 @@ def freesurfer_annot_to_vtk(annot_file, vtk_file, output_vtk='',
         the corresponding annot value
     background_value : integer or float
         background value
+    binary : bool
+        write a BINARY (big-endian) rather than an ASCII VTK file?
 
     Returns
     -------
@@ -1710,7 +1958,7 @@ def freesurfer_annot_to_vtk(annot_file, vtk_file, output_vtk='',
 
     from mindboggle.mio.vtks import rewrite_scalars
 
-    labels, ctab, names = nb.freesurfer.read_annot(annot_file)
+    labels_orig, ctab, names = nb.freesurfer.read_annot(annot_file, True)
 
     # Note regarding 2013 version of pip install nibabel:
     # (https://github.com/nipy/nibabel/issues/205#issuecomment-25294009)
@@ -1720,21 +1968,23 @@ def freesurfer_annot_to_vtk(annot_file, vtk_file, output_vtk='',
     # labels, and when set to 'False' assigns all otherwise unlabeled
     # left cortical vertices to 3, which is also assigned to the caudal
     # middle frontal gyrus.  To correct this ambiguity, this program assigns
-    # -1 to all vertices with label 0 in the original ('True') labels.
-    #
-    # Resolution:
-    #labels_orig, ctab, names = nb.freesurfer.read_annot(annot_file, True)
-    #labels[np.where(labels_orig == 0)[0]] = background_value
-    #
-    # Test removal of unlabeled cortex from label 3:
-    #labels[np.where(labels==3)[0]]=1000
+    # background_value to all vertices with label 0 in the original ('True')
+    # labels.  Rather than reading the file a second time to get the color
+    # table indices, we look up each original label value in the color table
+    # (values that are not in the color table are also set to background):
+    order = np.argsort(ctab[:, 4])
+    indices = np.searchsorted(ctab[order, 4], labels_orig)
+    labels = np.take(order, indices, mode='clip')
+    unlabeled = np.take(ctab[:, 4], labels) != labels_orig
+    unlabeled |= labels_orig == 0
+    np.putmask(labels, unlabeled, background_value)
 
     if not output_vtk:
         output_vtk = os.path.join(os.getcwd(),
             os.path.basename(annot_file).split('.annot', 1)[0] + '.vtk')
 
     rewrite_scalars(vtk_file, output_vtk, labels, 'Labels', [],
-                    background_value)
+                    background_value, binary)
 
     if not os.path.exists(output_vtk):
         raise IOError("Output VTK file " + output_vtk + " not created.")
@@ -130,31 +130,42 @@ def compute_likelihood(trained_file, depth_file, curvature_file, folds,
     nonborder_sigmas = depth_nonborder['sigmas'] * curv_nonborder['sigmas']
     norm_border = 1 / (twopiexp * border_sigmas + tiny)
     norm_nonborder = 1 / (twopiexp * nonborder_sigmas + tiny)
-    I = [i for i,x in enumerate(folds) if x != background_value]
+
+    # Gather the depths and curvatures of fold vertices once, and evaluate
+    # the Gaussian terms in place in preallocated arrays (the arithmetic
+    # is done in the same order as the expressions it replaces):
+    I = np.flatnonzero(np.asarray(folds) != background_value)
+    fold_depths = depths[I]
+    fold_curvatures = curvatures[I]
+    sums_border = np.zeros(len(I))
+    sums_nonborder = np.zeros(len(I))
+    exps = np.empty(len(I))
+    curv_terms = np.empty(len(I))
 
     N = depth_border['sigmas'].shape[0]
     for j in range(N):
-
-        # Border:
-        expB = depth_border['weights'][j] * \
-            ((depths[I]-depth_border['means'][j])**2) / \
-            depth_border['sigmas'][j]**2
-        expB += curv_border['weights'][j] * \
-            ((curvatures[I]-curv_border['means'][j])**2) / \
-            curv_border['sigmas'][j]**2
-        expB = -expB / 2
-        probs_border[I] = probs_border[I] + norm_border[j] * np.exp(expB)
-
-        # Non-border:
-        expNB = depth_nonborder['weights'][j] * \
-            ((depths[I]-depth_nonborder['means'][j])**2) / \
-            depth_nonborder['sigmas'][j]**2
-        expNB += curv_nonborder['weights'][j] * \
-            ((curvatures[I]-curv_nonborder['means'][j])**2) / \
-            curv_nonborder['sigmas'][j]**2
-        expNB = -expNB / 2
-        probs_nonborder[I] = probs_nonborder[I] + \
-                             norm_nonborder[j] * np.exp(expNB)
+        for sums, norms, depth, curv in \
+                [(sums_border, norm_border, depth_border, curv_border),
+                 (sums_nonborder, norm_nonborder, depth_nonborder,
+                  curv_nonborder)]:
+
+            # Border (or non-border):
+            np.subtract(fold_depths, depth['means'][j], out=exps)
+            np.square(exps, out=exps)
+            exps *= depth['weights'][j]
+            exps /= depth['sigmas'][j]**2
+            np.subtract(fold_curvatures, curv['means'][j], out=curv_terms)
+            np.square(curv_terms, out=curv_terms)
+            curv_terms *= curv['weights'][j]
+            curv_terms /= curv['sigmas'][j]**2
+            exps += curv_terms
+            exps *= -0.5
+            np.exp(exps, out=exps)
+            exps *= norms[j]
+            sums += exps
+
+    probs_border[I] = sums_border
+    probs_nonborder[I] = sums_nonborder
 
     likelihoods = probs_border / (probs_nonborder + probs_border + tiny)
     likelihoods = likelihoods.tolist()
@@ -264,13 +275,13 @@ def estimate_distribution(scalar_files, scalar_range, fold_files, label_files,
     >>> scalar_range = np.linspace(-1, 1, 101, endpoint=True) # (-1 to 1 by 0.02)
     >>> curv_border, curv_nonborder = estimate_distribution(scalar_files,
     ...     scalar_range, fold_files, label_files, verbose)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in depth_border['means']]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in depth_border['means']]
     [13.0869, 0.0, 0.0]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in depth_nonborder['means']]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in depth_nonborder['means']]
     [14.59311, 6.16008, 0.0]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in curv_border['means']]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in curv_border['means']]
     [3.06449, -0.76109, -3.43184]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in curv_nonborder['means']]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in curv_nonborder['means']]
     [0.62236, -1.55192, -5.19359]
     >>> pickle.dump([depth_border, curv_border, depth_nonborder, curv_nonborder],
     ...     open("depth_curv_border_nonborder_parameters.pkl", "wb"))
@@ -352,9 +363,9 @@ def concatenate_sulcus_scalars(scalar_files, fold_files, label_files,
     >>> background_value = -1
     >>> border, nonborder = concatenate_sulcus_scalars(scalar_files,
     ...     fold_files, label_files, background_value)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in border[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in border[0:5]]
     [3.48284, 2.57157, 4.27596, 4.56549, 3.84881]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in nonborder[0:5]]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in nonborder[0:5]]
     [2.87204, 2.89388, 3.55364, 2.81681, 3.70736]
 
     """
@@ -446,11 +457,11 @@ def fit_normals_to_histogram(data, x, verbose=False):
     >>> x = np.linspace(0, 1, 51, endpoint=True)
     >>> verbose = False
     >>> means, sigmas, weights = fit_normals_to_histogram(scalars, x, verbose)
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in means]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in means]
     [13.38742, 3.90712, 0.10946]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in sigmas]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in sigmas]
     [5.80721, 2.58297, 0.10209]
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in weights]
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in weights]
     [0.43959, 0.39286, 0.16755]
 
     """
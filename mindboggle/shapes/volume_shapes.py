@@ -70,10 +70,10 @@ def volume_per_brain_region(input_file, include_labels=[], exclude_labels=[],
     >>> unique_labels, volumes, table = volume_per_brain_region(input_file,
     ...     include_labels, exclude_labels, label_names, save_table,
     ...     output_table, verbose)
-    >>> [np.float("{0:.{1}f}".format(x, 5))
+    >>> [float("{0:.{1}f}".format(x, 5))
     ...  for x in [y for y in volumes if y > 0][0:5]]
     [971.99797, 2413.99496, 2192.99543, 8328.98262, 2940.99386]
-    >>> [np.float("{0:.{1}f}".format(x, 5))
+    >>> [float("{0:.{1}f}".format(x, 5))
     ...  for x in [y for y in volumes if y > 0][5:10]]
     [1997.99583, 10905.97725, 11318.97639, 10789.97749, 2700.99437]
 
@@ -87,8 +87,8 @@ def volume_per_brain_region(input_file, include_labels=[], exclude_labels=[],
 
     # Load labeled image volumes:
     img = nb.load(input_file)
-    volume_per_voxel = np.product(img.header.get_zooms())
-    labels = img.get_data().ravel()
+    volume_per_voxel = np.prod(img.header.get_zooms())
+    labels = np.asanyarray(img.dataobj).ravel()
 
     unique_labels, counts = count_per_label(labels, include_labels,
                                             exclude_labels)
@@ -101,11 +101,10 @@ def volume_per_brain_region(input_file, include_labels=[], exclude_labels=[],
         else:
             output_table = os.path.join(os.getcwd(),
                                         'volume_for_each_label.csv')
-        fid = open(output_table, 'w', encoding='utf-8')
         if len(label_names) == len(unique_labels):
-            fid.write("name, ID, volume\n")
+            rows = ["name, ID, volume\n"]
         else:
-            fid.write("ID, volume\n")
+            rows = ["ID, volume\n"]
 
         # Loop through labels:
         for ilabel, label in enumerate(unique_labels):
@@ -115,13 +114,18 @@ def volume_per_brain_region(input_file, include_labels=[], exclude_labels=[],
                     if verbose:
                         print('{0} ({1}) volume = {2:2.3f}mm^3\n'.format(
                               label_names[ilabel], label, volumes[ilabel]))
-                    fid.write('{0}, {1}, {2:2.3f}\n'.format(
-                              label_names[ilabel], label, volumes[ilabel]))
+                    rows.append('{0}, {1}, {2:2.3f}\n'.format(
+                                label_names[ilabel], label, volumes[ilabel]))
                 else:
                     if verbose:
                         print('{0} volume = {1:2.3f}mm^3\n'.format(
                               label, volumes[ilabel]))
-                    fid.write('{0}, {1:2.3f}\n'.format(label, volumes[ilabel]))
+                    rows.append('{0}, {1:2.3f}\n'.format(label,
+                                                          volumes[ilabel]))
+
+        with open(output_table, 'w', encoding='utf-8',
+                  buffering=1 << 20) as fid:
+            fid.writelines(rows)
     else:
         output_table = ''
 
@@ -131,7 +135,7 @@ def volume_per_brain_region(input_file, include_labels=[], exclude_labels=[],
 def thickinthehead(segmented_file, labeled_file,
                    cortex_value=2, noncortex_value=3, labels=[], names=[],
                    propagate=False, output_dir='', save_table=False,
-                   output_table='', verbose=False):
+                   output_table='', verbose=False, as_list=True):
     """
     Compute a simple thickness measure for each labeled cortex region volume.
 
@@ -204,10 +208,13 @@ def thickinthehead(segmented_file, labeled_file,
         name of output table file with label volumes and thickness values
     verbose : bool
         print statements?
+    as_list : bool
+        return label_volume_thickness as a list of lists
+        (or as a 3xN numpy array)?
 
     Returns
     -------
-    label_volume_thickness : list of lists of integers and floats
+    label_volume_thickness : list of lists (or array) of integers and floats
         label indices, volumes, and thickness values (default -1)
     output_table : string
         name of output table file with label volumes and thickness values
@@ -244,15 +251,17 @@ def thickinthehead(segmented_file, labeled_file,
     >>> label_volume_thickness, output_table = thickinthehead(segmented_file,
     ...     labeled_file, cortex_value, noncortex_value, labels, names,
     ...     propagate, output_dir, save_table, output_table, verbose) # doctest: +SKIP
-    >>> [np.int("{0:.{1}f}".format(x, 5)) label_volume_thickness[0][0:10]] # doctest: +SKIP
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in label_volume_thickness[1][0:5]] # doctest: +SKIP
-    >>> [np.float("{0:.{1}f}".format(x, 5)) for x in label_volume_thickness[2][0:5]] # doctest: +SKIP
+    >>> [int(x) for x in label_volume_thickness[0][0:10]] # doctest: +SKIP
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in label_volume_thickness[1][0:5]] # doctest: +SKIP
+    >>> [float("{0:.{1}f}".format(x, 5)) for x in label_volume_thickness[2][0:5]] # doctest: +SKIP
 
     """
     import os
     import numpy as np
     import nibabel as nb
     from io import open
+    from scipy.ndimage import binary_dilation, binary_erosion, \
+        generate_binary_structure
 
     from mindboggle.guts.utilities import execute
 
@@ -265,12 +274,7 @@ def thickinthehead(segmented_file, labeled_file,
     else:
         output_dir = os.getcwd()
     cortex = os.path.join(output_dir, 'cortex.nii.gz')
-    noncortex = os.path.join(output_dir, 'noncortex.nii.gz')
-    temp = os.path.join(output_dir, 'temp.nii.gz')
-    inner_edge = os.path.join(output_dir, 'cortex_inner_edge.nii.gz')
     use_outer_edge = True
-    if use_outer_edge:
-        outer_edge = os.path.join(output_dir, 'cortex_outer_edge.nii.gz')
 
     if save_table:
         if output_table:
@@ -278,23 +282,19 @@ def thickinthehead(segmented_file, labeled_file,
         else:
             output_table = os.path.join(os.getcwd(),
                                         'thickinthehead_for_each_label.csv')
-        fid = open(output_table, 'w', encoding='utf-8')
         if names:
-            fid.write("name, ID, thickness (thickinthehead)\n")
+            rows = ["name, ID, thickness (thickinthehead)\n"]
         else:
-            fid.write("ID, thickness (thickinthehead)\n")
+            rows = ["ID, thickness (thickinthehead)\n"]
     else:
         output_table = ''
 
     # ------------------------------------------------------------------------
-    # Extract noncortex and cortex:
+    # Extract cortex:
     # ------------------------------------------------------------------------
-    cmd = ['ThresholdImage', '3', segmented_file, noncortex,
-           str(noncortex_value), str(noncortex_value), '1 0']
-    execute(cmd, 'os')
     cmd = ['ThresholdImage', '3', segmented_file, cortex,
-           str(cortex_value), str(cortex_value), '1 0']
-    execute(cmd, 'os')
+           str(cortex_value), str(cortex_value), '1', '0']
+    execute(cmd, 'subprocess')
 
     # ------------------------------------------------------------------------
     # Either mask labels with cortex or fill cortex with labels:
@@ -302,106 +302,140 @@ def thickinthehead(segmented_file, labeled_file,
     if propagate:
         cmd = ['ImageMath', '3', cortex, 'PropagateLabelsThroughMask',
                cortex, labeled_file]
-        execute(cmd, 'os')
+        execute(cmd, 'subprocess')
     else:
         cmd = ['ImageMath', '3', cortex, 'm', cortex, labeled_file]
-        execute(cmd, 'os')
+        execute(cmd, 'subprocess')
 
     # ------------------------------------------------------------------------
-    # Load data and dimensions:
+    # Load dimensions (data are read below, one slab at a time):
     # ------------------------------------------------------------------------
     img = nb.load(cortex)
-    cortex_data = img.get_data().ravel()
+    segmented_img = nb.load(segmented_file)
     voxsize = img.header.get_zooms()
     voxvol = np.prod(voxsize)
     voxarea = (voxsize[0] * voxsize[1] + \
                voxsize[0] * voxsize[2] + \
                voxsize[1] * voxsize[2]) / 3
+    nslices = img.shape[2]
+    slab = 32
+    ball = generate_binary_structure(3, 2)
 
     # ------------------------------------------------------------------------
-    # Extract outer and inner boundary voxels of the cortex,
-    # by eroding 1 voxel for cortex voxels (=2) bordering
-    # the outside of the brain (=0) and bordering noncortex (=3):
+    # Count cortex, inner edge, and outer edge voxels for each label
+    # in a slab of slices (padded by one slice on either side so that
+    # the morphology below is exact for the slices in the slab):
     # ------------------------------------------------------------------------
-    cmd = ['ImageMath', '3', inner_edge, 'MD', noncortex, '1']
-    execute(cmd, 'os')
-    cmd = ['ImageMath', '3', inner_edge, 'm', cortex, inner_edge]
-    execute(cmd, 'os')
-    if use_outer_edge:
-        cmd = ['ThresholdImage', '3', cortex, outer_edge, '1 10000 1 0']
-        execute(cmd, 'os')
-        cmd = ['ImageMath', '3', outer_edge, 'ME', outer_edge, '1']
-        execute(cmd, 'os')
-        cmd = ['ThresholdImage', '3', outer_edge, outer_edge, '1 1 0 1']
-        execute(cmd, 'os')
-        cmd = ['ImageMath', '3', outer_edge, 'm', cortex, outer_edge]
-        execute(cmd, 'os')
-        cmd = ['ThresholdImage', '3', inner_edge, temp, '1 10000 1 0']
-        execute(cmd, 'os')
-        cmd = ['ThresholdImage', '3', temp, temp, '1 1 0 1']
-        execute(cmd, 'os')
-        cmd = ['ImageMath', '3', outer_edge, 'm', temp, outer_edge]
-        execute(cmd, 'os')
+    def count_slab_voxels(z0):
+        z1 = min(z0 + slab, nslices)
+        pad0 = max(z0 - 1, 0)
+        pad1 = min(z1 + 1, nslices)
+        cortex_data = np.asanyarray(img.dataobj[:, :, pad0:pad1])
+        cortex_data = cortex_data.astype(np.int64)
+        noncortex_data = np.asanyarray(
+            segmented_img.dataobj[:, :, pad0:pad1]) == noncortex_value
 
-    # ------------------------------------------------------------------------
-    # Load data:
-    # ------------------------------------------------------------------------
-    inner_edge_data = nb.load(inner_edge).get_data().ravel()
-    if use_outer_edge:
-        outer_edge_data = nb.load(outer_edge).get_data().ravel()
+        # --------------------------------------------------------------------
+        # Extract outer and inner boundary voxels of the cortex,
+        # by eroding 1 voxel for cortex voxels (=2) bordering
+        # the outside of the brain (=0) and bordering noncortex (=3)
+        # (in memory, with a radius-1 ball structuring element, i.e., the
+        # 18-connected 3x3x3 cube without corners that ITK's
+        # BinaryBallStructuringElement gives ImageMath MD/ME; as in ITK,
+        # erosion treats voxels outside the image as foreground):
+        # --------------------------------------------------------------------
+        noncortex_edge = binary_dilation(noncortex_data, structure=ball)
+        inner_edge_data = cortex_data * noncortex_edge
+        if use_outer_edge:
+            cortex_mask = cortex_data > 0
+            outer_edge_data = cortex_data * (cortex_mask &
+                                             ~binary_erosion(cortex_mask,
+                                                 structure=ball,
+                                                 border_value=1) &
+                                             ~noncortex_edge)
+        else:
+            outer_edge_data = np.zeros(cortex_data.shape, dtype=np.int64)
+
+        # Count voxels per label value, offset by the slab's smallest value
+        # so that negative labels can be counted as well (the edge data
+        # hold cortex labels or zeros):
+        inslab = slice(z0 - pad0, z1 - pad0)
+        offset = min(int(cortex_data[:, :, inslab].min()), 0)
+        return offset, [np.bincount(x[:, :, inslab].ravel() - offset)
+                        for x in [cortex_data, inner_edge_data,
+                                  outer_edge_data]]
+
+    slab_counts = [count_slab_voxels(z0) for z0 in range(0, nslices, slab)]
 
     # ------------------------------------------------------------------------
     # Loop through labels:
     # ------------------------------------------------------------------------
     if not labels:
-        labeled_data = nb.load(labeled_file).get_data().ravel()
+        labeled_data = np.asanyarray(nb.load(labeled_file).dataobj).ravel()
         labels = np.unique(labeled_data)
     labels = [int(x) for x in labels]
     label_volume_thickness = -1 * np.ones((len(labels), 3))
     label_volume_thickness[:, 0] = labels
-    for ilabel, label in enumerate(labels):
-        if names:
-            name = names[ilabel]
 
-        # --------------------------------------------------------------------
-        # Compute thickness as a ratio of label volume and layer surface area:
-        #   - Estimate middle cortical surface area by the average area
-        #     of the outer and inner boundary voxels of the cortex.
-        #   - Surface area is roughly estimated as the average face area
-        #     of a voxel times the number of voxels.
-        #   - Compute the volume of a labeled region of cortex.
-        #   - Estimate the thickness of the labeled cortical region as the
-        #     volume of the labeled region divided by the middle surface area.
-        # --------------------------------------------------------------------
-        label_cortex_volume = voxvol * len(np.where(cortex_data==label)[0])
-        label_inner_edge_area = voxarea * \
-                                  len(np.where(inner_edge_data==label)[0])
-        if label_inner_edge_area:
-            if use_outer_edge:
-                label_outer_edge_area = \
-                    voxarea * len(np.where(outer_edge_data==label)[0])
-                label_area = (label_inner_edge_area +
-                              label_outer_edge_area) / 2.0
+    offset = min([x[0] for x in slab_counts] + [min(labels + [0])])
+    nbins = max([x[0] + len(count) for x in slab_counts for count in x[1]] +
+                [max(labels + [0]) + 1]) - offset
+    label_counts = np.zeros((3, nbins), dtype=np.int64)
+    for slab_offset, counts in slab_counts:
+        start = slab_offset - offset
+        for icount, count in enumerate(counts):
+            label_counts[icount, start:start + len(count)] += count
+
+    # ------------------------------------------------------------------------
+    # Compute thickness as a ratio of label volume and layer surface area:
+    #   - Estimate middle cortical surface area by the average area
+    #     of the outer and inner boundary voxels of the cortex.
+    #   - Surface area is roughly estimated as the average face area
+    #     of a voxel times the number of voxels.
+    #   - Compute the volume of a labeled region of cortex.
+    #   - Estimate the thickness of the labeled cortical region as the
+    #     volume of the labeled region divided by the middle surface area.
+    # (The bincounts are indexed by label, so gather all labels at once.)
+    # ------------------------------------------------------------------------
+    ncounts = label_counts[:, np.array(labels, dtype=np.int64) - offset]
+
+    label_cortex_volumes = voxvol * ncounts[0]
+    label_inner_edge_areas = voxarea * ncounts[1]
+    if use_outer_edge:
+        label_outer_edge_areas = voxarea * ncounts[2]
+        label_areas = (label_inner_edge_areas + label_outer_edge_areas) / 2.0
+    else:
+        label_areas = label_inner_edge_areas
+    found = label_inner_edge_areas > 0
+    label_volume_thickness[found, 1] = label_cortex_volumes[found]
+    label_volume_thickness[found, 2] = label_cortex_volumes[found] / \
+                                       label_areas[found]
+
+    if save_table:
+        for ilabel in np.flatnonzero(found):
+            label = labels[ilabel]
+            thickness = label_volume_thickness[ilabel, 2]
+            if names:
+                name = names[ilabel]
+                if verbose:
+                    print('{0} ({1}) thickinthehead thickness = '
+                          '{2:2.2f}mm'.format(name, label, thickness))
+                rows.append('{0}, {1}, {2:2.3f}\n'.format(name, label,
+                                                          thickness))
             else:
-                label_area = label_inner_edge_area
-            thickness = label_cortex_volume / label_area
-            label_volume_thickness[ilabel, 1] = label_cortex_volume
-            label_volume_thickness[ilabel, 2] = thickness
+                if verbose:
+                    print('{0} thickinthehead thickness = {1:2.2f}mm'.
+                          format(label, thickness))
+                rows.append('{0}, {1:2.3f}\n'.format(label, thickness))
 
-            if save_table:
-                if names:
-                    if verbose:
-                        print('{0} ({1}) thickinthehead thickness = '
-                              '{2:2.2f}mm'.format(name, label, thickness))
-                    fid.write('{0}, {1}, {2:2.3f}\n'.format(name, label,
-                                                            thickness))
-                else:
-                    if verbose:
-                        print('{0} thickinthehead thickness = {1:2.2f}mm'.
-                              format(label, thickness))
-                    fid.write('{0}, {1:2.3f}\n'.format(label, thickness))
+    if save_table:
+        with open(output_table, 'w', encoding='utf-8',
+                  buffering=1 << 20) as fid:
+            fid.writelines(rows)
 
-    label_volume_thickness = label_volume_thickness.transpose().tolist()
+    label_volume_thickness = label_volume_thickness.transpose()
+    if as_list:
+        label_volume_thickness = label_volume_thickness.tolist()
 
     return label_volume_thickness, output_table
 
@@ -77,28 +77,26 @@ def antsApplyTransformsToPoints(points, transform_files,
     # Write points (x,y,z,1) to a .csv file:
     # ------------------------------------------------------------------------
     points_file = os.path.join(os.getcwd(), 'points.csv')
-    fid = open(points_file, 'w', encoding='utf-8')
-    fid.write('x,y,z,t\n')
-    fid.close()
-    fid = open(points_file, 'a', encoding='utf-8')
+    # One row per vertex, joined into a single string and written at once:
+    rows = ['x,y,z,t\n']
     for point in points:
         string_of_zeros = (4 - len(point)) * ',0'
-        fid.write(','.join([str(x) for x in point]) + string_of_zeros + '\n')
-    fid.close()
+        rows.append(','.join([str(x) for x in point]) + string_of_zeros + '\n')
+    with open(points_file, 'w', encoding='utf-8') as fid:
+        fid.write(''.join(rows))
 
     # ------------------------------------------------------------------------
     # Apply transforms to points in .csv file:
     # ------------------------------------------------------------------------
     transformed_points_file = os.path.join(os.getcwd(),
                                            'transformed_points.csv')
-    transform_string = ''
-    for ixfm, transform_file in enumerate(transform_files):
-        transform_string += " --t [{0},{1}]".\
-            format(transform_file, str(inverse_booleans[ixfm]))
     cmd = ['antsApplyTransformsToPoints', '-d', '3', '-i', points_file,
-           '-o', transformed_points_file, transform_string]
+           '-o', transformed_points_file]
+    for ixfm, transform_file in enumerate(transform_files):
+        cmd.extend(['--t', '[{0},{1}]'.format(transform_file,
+                                             str(inverse_booleans[ixfm]))])
     try:
-        execute(cmd, 'os')
+        execute(cmd, 'subprocess')
     except:
         raise Exception("Cannot find antsApplyTransformsToPoints command.")
 
@@ -184,7 +182,7 @@ def ImageMath(volume1, volume2, operator='m', output_file=''):
                                    os.path.basename(volume1) + '_' +
                                    os.path.basename(volume2))
     cmd = ['ImageMath', '3', output_file, operator, volume1, volume2]
-    execute(cmd, 'os')
+    execute(cmd, 'subprocess')
     if not os.path.exists(output_file):
         raise IOError("ImageMath did not create " + output_file + ".")
 
@@ -242,7 +240,7 @@ def ThresholdImage(volume, output_file='', threshlo=1, threshhi=10000):
                                    'threshold_' + os.path.basename(volume))
     cmd = ['ThresholdImage', '3', volume, output_file,
            str(threshlo), str(threshhi)]
-    execute(cmd, 'os')
+    execute(cmd, 'subprocess')
     if not os.path.exists(output_file):
         raise IOError("ThresholdImage did not create " + output_file + ".")
 
@@ -254,8 +252,8 @@ def PropagateLabelsThroughMask(mask, labels, mask_index=None, output_file='',
     """
     Use ANTs to fill a binary volume mask with initial labels.
 
-    This program uses ThresholdImage and the ImageMath
-    PropagateLabelsThroughMask functions in ANTs.
+    This program thresholds the mask (as ANTs ThresholdImage would)
+    and uses the ImageMath PropagateLabelsThroughMask function in ANTs.
 
     ThresholdImage ImageDimension ImageIn.ext outImage.ext
         threshlo threshhi <insideValue> <outsideValue>
@@ -307,6 +305,8 @@ def PropagateLabelsThroughMask(mask, labels, mask_index=None, output_file='',
 
     """
     import os
+    import numpy as np
+    import nibabel as nb
     from mindboggle.guts.utilities import execute
 
     if not output_file:
@@ -318,21 +318,21 @@ def PropagateLabelsThroughMask(mask, labels, mask_index=None, output_file='',
 
     print('mask: {0}, labels: {1}'.format(mask, labels))
 
-    # Binarize image volume:
-    if binarize:
-        temp_file = os.path.join(os.getcwd(),
-                                 'PropagateLabelsThroughMask.nii.gz')
-        cmd = ['ThresholdImage', '3', mask, temp_file, '0 1 0 1']
-        execute(cmd, 'os')
-        mask = temp_file
-
-    # Mask with just voxels having mask_index value:
-    if mask_index:
-        mask2 = os.path.join(os.getcwd(), 'temp.nii.gz')
-
-        cmd = ['ThresholdImage', '3', mask, mask2,
-               str(mask_index), str(mask_index)]
-        execute(cmd, 'os')
+    # Binarize image volume and/or mask with just voxels having mask_index
+    # value (same as ThresholdImage with '0 1 0 1', then with
+    # 'mask_index mask_index'), in memory, writing a single mask file:
+    if binarize or mask_index:
+        img = nb.load(mask)
+        data = np.asanyarray(img.dataobj)
+        if binarize:
+            data = (data < 0) | (data > 1)
+        if mask_index:
+            data = data == mask_index
+        mask2 = os.path.join(os.getcwd(), 'PropagateLabelsThroughMask.nii.gz')
+        mask_img = nb.Nifti1Image(data.astype(np.uint8), img.affine,
+                                  img.header)
+        mask_img.set_data_dtype(np.uint8)
+        mask_img.to_filename(mask2)
     else:
         mask2 = mask
 
@@ -341,8 +341,8 @@ def PropagateLabelsThroughMask(mask, labels, mask_index=None, output_file='',
     cmd = ['ImageMath', '3', output_file, 'PropagateLabelsThroughMask',
            mask2, labels]
     if stopvalue:
-        cmd.extend(str(stopvalue))
-    execute(cmd, 'os')
+        cmd.append(str(stopvalue))
+    execute(cmd, 'subprocess')
     if not os.path.exists(output_file):
         raise IOError("ImageMath did not create " + output_file + ".")
 
@@ -415,7 +415,7 @@ def ResampleImageBySpacing(volume, output_file='', outxspc=1, outyspc=1,
                                    'resampled_' + os.path.basename(volume))
     cmd = ['ResampleImageBySpacing', '3', volume, output_file,
            str(outxspc), str(outyspc), str(outzspc)]
-    execute(cmd, 'os')
+    execute(cmd, 'subprocess')
     if not os.path.exists(output_file):
         raise IOError("ResampleImageBySpacing did not create {0).".
                       format(output_file))
@@ -6,41 +6,62 @@ Mindboggle: package for automated human brain image labeling and morphometry.
 
 """
 
+import ast
 import os
-import sys
 from os.path import join as pjoin
 
-# BEFORE importing distguts, remove MANIFEST. distguts doesn't properly
-# update it when the contents of directories change.
-if os.path.exists('MANIFEST'): os.remove('MANIFEST')
+# Use setuptools for all commands (distutils was removed in Python 3.12):
+from setuptools import setup
+
+
+def read_assignments(py_file, namespace=None):
+    """
+    Collect constant assignments from a Python file without executing it.
+
+    Values are literals or names assigned earlier (in the file or in the
+    given namespace); other assignments are skipped.
+    """
+    namespace = dict(namespace or {})
+    with open(py_file) as fid:
+        tree = ast.parse(fid.read(), py_file)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and \
+                isinstance(node.targets[0], ast.Name):
+            if isinstance(node.value, ast.Name):
+                if node.value.id in namespace:
+                    namespace[node.targets[0].id] = namespace[node.value.id]
+            else:
+                try:
+                    namespace[node.targets[0].id] = \
+                        ast.literal_eval(node.value)
+                except ValueError:
+                    pass
+    return namespace
 
-# For some commands, use setuptools.
-if len(set(('develop', 'bdist_egg', 'bdist_rpm', 'bdist', 'bdist_dumb',
-            'bdist_wininst', 'install_egg_info', 'egg_info', 'easy_install',
-            )).intersection(sys.argv)) > 0:
-    pass
-from distutils.core import setup
 
 # Get version and release info, which is all stored in info.py
+# (parsed rather than executed, since info.py imports the version
+# from the mindboggle package, which would import the package):
 ver_file = pjoin(os.getcwd(), 'info.py')
-exec(open(ver_file).read())
+info = read_assignments(ver_file, read_assignments(
+    pjoin(os.getcwd(), 'mindboggle', 'version.py')))
 
 def main(**extra_args):
-    setup(name=NAME,
-          maintainer=MAINTAINER,
-          maintainer_email=MAINTAINER_EMAIL,
-          description=DESCRIPTION,
-          long_description=LONG_DESCRIPTION,
-          url=URL,
-          download_url=DOWNLOAD_URL,
-          license=LICENSE,
-          classifiers=CLASSIFIERS,
-          author=AUTHOR,
-          author_email=AUTHOR_EMAIL,
-          platforms=PLATFORMS,
-          version=VERSION,
-          requires=REQUIRES,
-          provides=PROVIDES,
+    setup(name=info['NAME'],
+          maintainer=info['MAINTAINER'],
+          maintainer_email=info['MAINTAINER_EMAIL'],
+          description=info['DESCRIPTION'],
+          long_description=info['LONG_DESCRIPTION'],
+          url=info['URL'],
+          download_url=info['DOWNLOAD_URL'],
+          license=info['LICENSE'],
+          classifiers=info['CLASSIFIERS'],
+          author=info['AUTHOR'],
+          author_email=info['AUTHOR_EMAIL'],
+          platforms=info['PLATFORMS'],
+          version=info['VERSION'],
+          requires=info['REQUIRES'],
+          provides=info['PROVIDES'],
           packages=['mindboggle',
                     'mindboggle.data',
                     'mindboggle.evaluate',